@@ -1,37 +1,190 @@
+"""
+Headless EdgeOS client, runs the login, WS and API pipeline of the integration without Home Assistant.
+
+Run from the root of the repository (requires the integration's dependencies):
+    python . --host 192.168.1.1 --username ubnt --password ubnt --duration 3600 --snapshot-dir snapshots
+"""
+import argparse
 import asyncio
+import json
 import logging
-import time
-from custom_components.edgeos import EdgeOS
+import os
+from datetime import datetime
+from time import perf_counter
 
-from custom_components.edgeos.const import SCAN_INTERVAL
+from custom_components.edgeos.EdgeOSData import EdgeOSData
+from custom_components.edgeos.const import *
 
-logging.basicConfig(filename="log.txt", filemode="a", level="DEBUG")
+_LOGGER = logging.getLogger(__name__)
 
 
-loop = asyncio.get_event_loop()
+class HeadlessClient:
+    def __init__(self, args):
+        self._args = args
 
+        entry_data = {
+            CONF_NAME: args.name,
+            CONF_HOST: args.host,
+            CONF_USERNAME: args.username,
+            CONF_PASSWORD: args.password
+        }
 
-class Test:
-    def __init__(self):
-        self._instance = None
+        self._data_manager = EdgeOSData(None, entry_data, self.update)
 
-    async def load(self):
-        self._instance = EdgeOS(None, "", "", "", True, ["eth0"], ["device"], "M",
-                                SCAN_INTERVAL, True)
+        self._updates = 0
+        self._changed_records = 0
+        self._previous = None
 
-    async def refresh(self):
+    def update(self):
+        """Consumes the changes like the entity manager does."""
+        changes = self._data_manager.pop_changes()
+
+        self._updates += 1
+
+        for key in changes:
+            self._changed_records += max(len(changes[key]), 1)
+
+    def get_counters(self):
+        web_socket = self._data_manager.web_socket
+        api = self._data_manager.api
+
+        counters = {
+            'time': perf_counter(),
+            'ws_messages': web_socket.messages_received,
+            'ws_decode_time': web_socket.decode_time,
+            'api_requests': api.requests,
+            'api_request_time': api.request_time,
+            'updates': self._updates,
+            'changed_records': self._changed_records
+        }
+
+        return counters
+
+    def print_stats(self):
+        counters = self.get_counters()
+        previous = self._previous or {key: 0 for key in counters}
+
+        elapsed = counters['time'] - previous.get('time', counters['time'])
+        ws_messages = counters['ws_messages'] - previous['ws_messages']
+        api_requests = counters['api_requests'] - previous['api_requests']
+
+        self._previous = counters
+
+        if elapsed <= 0:
+            return
+
+        decode_ms = 0
+        api_latency_ms = 0
+
+        if ws_messages > 0:
+            decode_ms = (counters['ws_decode_time'] - previous['ws_decode_time']) * 1000 / ws_messages
+
+        if api_requests > 0:
+            api_latency_ms = (counters['api_request_time'] - previous['api_request_time']) * 1000 / api_requests
+
+        updates = counters['updates'] - previous['updates']
+        changed_records = counters['changed_records'] - previous['changed_records']
+
+        print(f'WS: {ws_messages / elapsed:.1f} msg/s (decode {decode_ms:.3f}ms), '
+              f'API: {api_requests} requests (latency {api_latency_ms:.1f}ms), '
+              f'Updates: {updates / elapsed:.1f}/s, Changed records: {changed_records / elapsed:.1f}/s, '
+              f'Reconnects: {self._data_manager.reconnect_count}', flush=True)
+
+    def save_snapshot(self):
+        snapshot_dir = self._args.snapshot_dir
+        path = os.path.join(snapshot_dir, f'edgeos_{datetime.now().strftime("%Y%m%d%H%M%S")}.json')
+
+        with open(path, 'w') as out:
+            json.dump(self._data_manager.edgeos_data, out, indent=2, default=str)
+
+        _LOGGER.info(f'Snapshot saved to {path}')
+
+    async def run_periodically(self, interval, action):
         while True:
-            await self._instance.refresh()
+            await asyncio.sleep(interval)
 
-            time.sleep(20)
+            await action()
 
+    async def refresh(self):
+        await self._data_manager.refresh()
 
-if __name__ == "__main__":
-    t = Test()
-    loop.run_until_complete(t.load())
-    loop.run_until_complete(t.refresh())
+    async def stats(self):
+        self.print_stats()
 
+    async def snapshot(self):
+        self.save_snapshot()
 
+    async def run(self):
+        args = self._args
+
+        if args.snapshot_dir is not None:
+            os.makedirs(args.snapshot_dir, exist_ok=True)
+
+        started = perf_counter()
+
+        await self._data_manager.initialize()
+
+        if not self._data_manager.api.is_connected:
+            await self._data_manager.terminate()
+
+            raise RuntimeError(f'Failed to connect to {args.host}')
+
+        print(f'Initialized in {perf_counter() - started:.3f} seconds', flush=True)
+
+        self._previous = self.get_counters()
+
+        tasks = [
+            asyncio.ensure_future(self.run_periodically(args.poll_interval, self.refresh)),
+            asyncio.ensure_future(self.run_periodically(args.stats_interval, self.stats))
+        ]
+
+        if args.snapshot_dir is not None:
+            tasks.append(asyncio.ensure_future(self.run_periodically(args.snapshot_interval, self.snapshot)))
+
+        try:
+            if args.duration is None:
+                await asyncio.gather(*tasks)
+            else:
+                await asyncio.sleep(args.duration)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            self.print_stats()
+
+            if args.snapshot_dir is not None:
+                self.save_snapshot()
+
+            await self._data_manager.terminate()
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Headless EdgeOS client')
+
+    parser.add_argument('--host', required=True, help='Host or host:port of the router')
+    parser.add_argument('--username', default=DEFAULT_USERNAME)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--name', default=DEFAULT_NAME)
+    parser.add_argument('--duration', type=float, default=None, help='Seconds to run, runs until stopped by default')
+    parser.add_argument('--poll-interval', type=float, default=SCAN_INTERVAL_API.total_seconds(),
+                        help='Seconds between API polls')
+    parser.add_argument('--stats-interval', type=float, default=10, help='Seconds between printed stats')
+    parser.add_argument('--snapshot-dir', default=None, help='Dump the EdgeOS data as JSON into this directory')
+    parser.add_argument('--snapshot-interval', type=float, default=60, help='Seconds between snapshots')
+    parser.add_argument('--log-level', default='WARNING')
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
 
+    logging.basicConfig(level=arguments.log_level.upper())
 
+    client = HeadlessClient(arguments)
 
+    try:
+        asyncio.run(client.run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,3 @@
+"""
+Benchmarks of the hot paths, run by pytest-benchmark (see test_hot_paths.py).
+"""
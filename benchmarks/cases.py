@@ -0,0 +1,160 @@
+"""
+Stand-ins and fixtures of the benchmarks, built from the simulator payloads.
+"""
+import json
+
+from simulator.data import EdgeOSSimulatorData
+
+from custom_components.edgeos.EdgeOSData import EdgeOSData
+from custom_components.edgeos.entity_manager import EntityManager
+from custom_components.edgeos.const import *
+
+BENCHMARK_NAME = 'benchmark'
+
+
+class BenchmarkRegistryEntry:
+    def __init__(self, entity_id, domain, platform, unique_id):
+        self.entity_id = entity_id
+        self.domain = domain
+        self.platform = platform
+        self.unique_id = unique_id
+
+
+class BenchmarkEntityRegistry:
+    """Surface of the entity registry used by EntityManager.
+
+    Entity ids are looked up by scanning all entries, as the registry of the
+    Home Assistant releases this integration was written for did.
+    """
+
+    def __init__(self):
+        self.entities = {}
+
+    def register(self, domain, platform, unique_id):
+        entity_id = f'{domain}.{platform}_{len(self.entities)}'
+
+        self.entities[entity_id] = BenchmarkRegistryEntry(entity_id, domain, platform, unique_id)
+
+    def async_get(self, entity_id):
+        return self.entities.get(entity_id)
+
+    def async_get_entity_id(self, domain, platform, unique_id):
+        for entry in self.entities.values():
+            if entry.domain == domain and entry.platform == platform and entry.unique_id == unique_id:
+                return entry.entity_id
+
+        return None
+
+    def async_remove(self, entity_id):
+        self.entities.pop(entity_id, None)
+
+
+class BenchmarkBus:
+    @staticmethod
+    def async_listen(event_type, listener):
+        return lambda: None
+
+
+class BenchmarkHass:
+    """Surface of Home Assistant used by EntityManager."""
+
+    def __init__(self):
+        self.bus = BenchmarkBus()
+
+
+class BenchmarkComponent:
+    """Stands in for the entity classes, which require a running Home Assistant."""
+
+    def __init__(self, hass, ha, entity):
+        self.entity = entity
+        self.entity_id = None
+
+
+class BenchmarkHomeAssistant:
+    """Surface of EdgeOSHomeAssistant used by EntityManager."""
+
+    def __init__(self, data_manager, entity_registry=None):
+        self.data_manager = data_manager
+        self.integration_name = BENCHMARK_NAME
+        self.unit = ATTR_BYTE
+        self.unit_size = BYTE
+        self.entity_registry = entity_registry
+
+
+def get_simulator_data(clients=0, interfaces=0, dpi_categories=0):
+    data = EdgeOSSimulatorData(clients=clients,
+                               interfaces=interfaces,
+                               vifs=2,
+                               dpi_categories=dpi_categories,
+                               unknown_clients=clients,
+                               active_ratio=1,
+                               seed=1)
+
+    return data
+
+
+def get_data_manager(simulator_data=None):
+    entry_data = {
+        CONF_NAME: BENCHMARK_NAME,
+        CONF_HOST: '127.0.0.1',
+        CONF_USERNAME: DEFAULT_USERNAME,
+        CONF_PASSWORD: DEFAULT_USERNAME
+    }
+
+    data_manager = EdgeOSData(None, entry_data, lambda: None)
+
+    if simulator_data is not None:
+        config = simulator_data.get_config()
+
+        data_manager.load_devices(config)
+        data_manager.load_interfaces(config)
+
+    return data_manager
+
+
+def get_frame(topic, payload):
+    content = json.dumps({topic: payload}, separators=(STRING_COMMA, STRING_COLON))
+
+    return f'{len(content)}\n{content}'
+
+
+def get_entity_manager(data_manager, entity_registry):
+    entity_manager = EntityManager(BenchmarkHass(), BenchmarkHomeAssistant(data_manager, entity_registry))
+
+    # Versions before the registry cache look the entity ids up in the registry
+    if hasattr(entity_manager, 'initialize_entity_ids'):
+        entity_manager.initialize_entity_ids()
+
+    for domain in SIGNALS:
+        entity_manager.set_domain_component(domain, lambda entities, update_before_add: None, BenchmarkComponent)
+
+    interfaces = list(data_manager.get_interfaces().keys())
+    devices = list(data_manager.get_devices().keys())
+
+    # Options supported by all versions, so results can be compared with versions before the selection rules
+    entity_manager.update_options({
+        CONF_MONITORED_INTERFACES: interfaces,
+        CONF_MONITORED_DEVICES: devices,
+        CONF_TRACK_DEVICES: devices
+    })
+
+    return entity_manager
+
+
+def get_entity_registry(data_manager):
+    """Registry holding the entities of all clients and interfaces, as after a restart."""
+    entity_registry = BenchmarkEntityRegistry()
+    entity_manager = get_entity_manager(data_manager, BenchmarkEntityRegistry())
+
+    data_manager.update()
+    entity_manager.update()
+
+    for domain in SIGNALS:
+        entities = entity_manager.get_entities(domain)
+
+        for entity_key in entities:
+            name = entities[entity_key].get(ENTITY_NAME)
+
+            entity_registry.register(domain, DOMAIN, f'{DEFAULT_NAME}-{domain}-{name}')
+
+    return entity_registry
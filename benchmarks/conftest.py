@@ -0,0 +1,40 @@
+"""
+Parametrization of the benchmarks by client, interface and DPI category counts.
+"""
+import pytest
+
+BENCHMARK_COUNTS = {
+    'clients': [100, 1000],
+    'interfaces': [5, 20],
+    'dpi_categories': [4, 16]
+}
+
+
+def _get_counts(value):
+    return [int(item) for item in value.split(',')]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('edgeos', 'EdgeOS benchmarks')
+
+    for name in BENCHMARK_COUNTS:
+        group.addoption(f'--{name.replace("_", "-")}',
+                        dest=name,
+                        type=_get_counts,
+                        default=BENCHMARK_COUNTS[name],
+                        help=f'Comma separated {name.replace("_", " ")} counts')
+
+    group.addoption('--rounds', type=int, default=20, help='Timed rounds of each benchmark')
+
+
+def pytest_generate_tests(metafunc):
+    for name in BENCHMARK_COUNTS:
+        if name in metafunc.fixturenames:
+            counts = metafunc.config.getoption(name)
+
+            metafunc.parametrize(name, counts, ids=[f'{name}={count}' for count in counts])
+
+
+@pytest.fixture
+def rounds(request):
+    return request.config.getoption('rounds')
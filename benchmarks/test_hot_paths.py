@@ -0,0 +1,115 @@
+"""
+Benchmarks of the hot paths, run by pytest-benchmark.
+"""
+import asyncio
+
+import pytest
+
+from custom_components.edgeos.web_socket import EdgeOSWebSocket
+from custom_components.edgeos.const import *
+
+from .cases import *
+
+pytest.importorskip('pytest_benchmark')
+
+WARMUP_ROUNDS = 2
+
+
+def run(benchmark, target, rounds, setup=None):
+    """Time target(*setup()) for each round, setup is excluded from the timing."""
+    pedantic_setup = None
+
+    if setup is not None:
+        def pedantic_setup():
+            return setup(), {}
+
+    benchmark.pedantic(target, setup=pedantic_setup, rounds=rounds, warmup_rounds=WARMUP_ROUNDS)
+
+
+def test_parse_message(benchmark, rounds, clients, dpi_categories):
+    simulator_data = get_simulator_data(clients, dpi_categories=dpi_categories)
+    frame = get_frame(EXPORT_KEY, simulator_data.get_export())
+
+    web_socket = EdgeOSWebSocket(None, API_URL_TEMPLATE.format('127.0.0.1'), [EXPORT_KEY], lambda payload: None)
+
+    run(benchmark, web_socket.parse_message, rounds, lambda: (frame,))
+
+
+def test_handle_export(benchmark, rounds, clients, dpi_categories):
+    simulator_data = get_simulator_data(clients, dpi_categories=dpi_categories)
+    data_manager = get_data_manager(simulator_data)
+
+    run(benchmark, data_manager.handle_export, rounds, lambda: (simulator_data.get_export(),))
+
+
+def test_handle_interfaces(benchmark, rounds, interfaces):
+    simulator_data = get_simulator_data(interfaces=interfaces)
+    data_manager = get_data_manager(simulator_data)
+
+    run(benchmark, data_manager.handle_interfaces, rounds, lambda: (simulator_data.get_interfaces(),))
+
+
+def test_load_devices(benchmark, rounds, clients):
+    simulator_data = get_simulator_data(clients)
+    data_manager = get_data_manager()
+    config = simulator_data.get_config()
+
+    run(benchmark, data_manager.load_devices, rounds, lambda: (config,))
+
+
+def test_load_unknown_devices(benchmark, rounds, clients):
+    simulator_data = get_simulator_data(clients)
+    data_manager = get_data_manager()
+    dhcp_leases = simulator_data.get_dhcp_leases()
+    loop = asyncio.new_event_loop()
+
+    async def get_general_data(item):
+        return dhcp_leases
+
+    # Responds with the simulated leases instead of requesting the router
+    data_manager.api.get_general_data = get_general_data
+
+    def load_unknown_devices():
+        loop.run_until_complete(data_manager.load_unknown_devices())
+
+    try:
+        run(benchmark, load_unknown_devices, rounds)
+    finally:
+        loop.close()
+
+
+def test_entity_manager_update(benchmark, rounds, clients, interfaces, dpi_categories):
+    """Incremental update after an export of all clients and an interfaces message."""
+    simulator_data = get_simulator_data(clients, interfaces, dpi_categories)
+    data_manager = get_data_manager(simulator_data)
+
+    entity_manager = get_entity_manager(data_manager, get_entity_registry(data_manager))
+
+    data_manager.update()
+    entity_manager.update()
+
+    def setup():
+        data_manager.handle_export(simulator_data.get_export())
+        data_manager.handle_interfaces(simulator_data.get_interfaces())
+
+        return ()
+
+    benchmark.extra_info['entities'] = sum([len(entity_manager.get_entities(domain)) for domain in SIGNALS])
+
+    run(benchmark, entity_manager.update, rounds, setup)
+
+
+def test_entity_manager_create(benchmark, rounds, clients, interfaces, dpi_categories):
+    """First update of a new entity manager, each entity gets its entity id from the registry."""
+    simulator_data = get_simulator_data(clients, interfaces, dpi_categories)
+    data_manager = get_data_manager(simulator_data)
+    entity_registry = get_entity_registry(data_manager)
+
+    def create():
+        entity_manager = get_entity_manager(data_manager, entity_registry)
+
+        entity_manager.update()
+
+    benchmark.extra_info['entities'] = len(entity_registry.entities)
+
+    run(benchmark, create, rounds)
@@ -5,6 +5,8 @@ https://home-assistant.io/components/edgeos/
 """
 import sys
 import logging
+import asyncio
+from time import perf_counter
 
 from .const import *
 from .web_api import EdgeOSWebAPI
@@ -15,12 +17,19 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class EdgeOSData(object):
-    def __init__(self, hass, entry_data, update_home_assistant):
+    def __init__(self, hass, entry_data, update_home_assistant, login_semaphore=None):
         self._hass = hass
         self._update_home_assistant = update_home_assistant
+        self._login_semaphore = login_semaphore
 
         self._is_initialized = False
 
+        self._reconnect_task = None
+        self._reconnect_count = 0
+        self._ws_task = None
+        self._initialize_started = None
+        self._is_first_ws_frame = True
+
         self._host = entry_data.get(CONF_HOST)
         self._username = entry_data.get(CONF_USERNAME, DEFAULT_USERNAME)
         self._password = entry_data.get(CONF_PASSWORD)
@@ -30,6 +39,10 @@ class EdgeOSData(object):
         self._is_updating = False
         self._edgeos_data = {}
         self._system_data = {}
+        self._changes = {CHANGES_CONSUMER_ENTITIES: {}}
+        self._neighbour_addresses = {}
+        self._cached_devices_data = None
+        self._available_options = {}
 
         self._ws_handlers = self.get_ws_handlers()
         self._topics = self._ws_handlers.keys()
@@ -41,7 +54,11 @@ class EdgeOSData(object):
                                    self._topics,
                                    self.ws_handler)
 
-        self._edgeos_login_service = EdgeOSWebLogin(self._host, self._username, self._password)
+        self._edgeos_login_service = EdgeOSWebLogin(self._hass,
+                                                    self._host,
+                                                    self._username,
+                                                    self._password,
+                                                    entry_data.get(CONF_NAME))
 
     @property
     def edgeos_data(self):
@@ -51,43 +68,115 @@ class EdgeOSData(object):
     def system_data(self):
         return self._system_data
 
-    async def initialize(self, call_after_refresh=None):
+    @property
+    def api(self) -> EdgeOSWebAPI:
+        return self._api
+
+    @property
+    def web_socket(self) -> EdgeOSWebSocket:
+        return self._ws
+
+    async def login(self, reuse_session=True):
+        if self._login_semaphore is None:
+            return await self._login(reuse_session)
+
+        async with self._login_semaphore:
+            return await self._login(reuse_session)
+
+    async def _login(self, reuse_session):
+        login_service = self._edgeos_login_service
+
+        if reuse_session and await login_service.restore_session():
+            return True
+
+        result = await login_service.login()
+
+        return result
+
+    async def initialize(self, call_after_refresh=None, reuse_session=True):
         try:
-            if self._edgeos_login_service.login():
-                cookies = self._edgeos_login_service.cookies_data
-                session_id = self._edgeos_login_service.session_id
+            self._initialize_started = perf_counter()
+            self._is_first_ws_frame = True
+
+            if await self.login(reuse_session):
+                cookie_jar = self._edgeos_login_service.cookie_jar
 
                 _LOGGER.debug(f'Initializing API')
 
-                await self._api.initialize(cookies)
+                await self._api.initialize(cookie_jar)
+
+                # WS connects while the initial snapshot is requested
+                self.start_ws()
 
                 _LOGGER.debug(f'Requesting initial data')
                 await self.refresh()
 
                 if call_after_refresh is not None:
                     await call_after_refresh()
-
-                _LOGGER.debug(f'Initializing WS using session: {session_id}')
-                await self._ws.initialize(cookies, session_id)
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
             _LOGGER.error(f"Failed to initialize EdgeOS Manager, Error: {str(ex)}, Line: {line_number}")
 
+    def start_ws(self):
+        cookie_jar = self._edgeos_login_service.cookie_jar
+        session_id = self._edgeos_login_service.session_id
+
+        _LOGGER.debug(f'Initializing WS using session: {session_id}')
+
+        ws_initialize = self._ws.initialize(cookie_jar, session_id)
+
+        if self._hass is None:
+            self._ws_task = asyncio.ensure_future(ws_initialize)
+        else:
+            self._ws_task = self._hass.async_create_task(ws_initialize)
+
     @property
     def is_initialized(self):
         return self._is_initialized
 
+    @property
+    def reconnect_count(self):
+        return self._reconnect_count
+
     def log_events(self, log_event_enabled):
         self._ws.log_events(log_event_enabled)
 
     async def edgeos_disconnection_handler(self):
-        _LOGGER.debug(f'Disconnection detected, reconnecting...')
+        """Reconnect once for all concurrent callers, returns whether the new session is ready."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_count += 1
+
+            _LOGGER.debug(f'Disconnection detected, reconnecting (Attempt #{self._reconnect_count})')
+
+            self._reconnect_task = asyncio.ensure_future(self.reconnect())
+        else:
+            _LOGGER.debug(f'Disconnection detected, waiting for reconnection in progress')
+
+        result = await asyncio.shield(self._reconnect_task)
+
+        return result
+
+    async def reconnect(self):
+        try:
+            await self.terminate()
+
+            if not await self.login(reuse_session=False):
+                return False
+
+            await self._api.initialize(self._edgeos_login_service.cookie_jar)
 
-        await self.terminate()
+            self.start_ws()
+
+            return True
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
 
-        await self.initialize()
+            _LOGGER.error(f"Failed to reconnect EdgeOS Manager, Error: {str(ex)}, Line: {line_number}")
+
+        return False
 
     async def terminate(self):
         try:
@@ -95,7 +184,16 @@ class EdgeOSData(object):
 
             await self._ws.close()
 
+            if self._ws_task is not None and not self._ws_task.done():
+                self._ws_task.cancel()
+
+                await asyncio.wait([self._ws_task])
+
+            self._ws_task = None
+
             _LOGGER.debug(f'WS terminated')
+
+            await self._edgeos_login_service.close()
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
@@ -120,18 +218,28 @@ class EdgeOSData(object):
             interfaces = self.get_interfaces()
             system_state = self.get_system_state()
             unknown_devices = self.get_unknown_devices()
+            diagnostics = self.get_diagnostics()
 
             api_last_update = self._api.last_update
             web_socket_last_update = self._ws.last_update
 
             if system_state is not None:
-                system_state[IS_ALIVE] = self._api.is_connected
+                is_alive = self._api.is_connected
+
+                if system_state.get(IS_ALIVE) != is_alive:
+                    system_state[IS_ALIVE] = is_alive
+
+                    self.set_changed(SYSTEM_STATS_KEY)
+
+            if api_last_update != self._system_data.get(ATTR_API_LAST_UPDATE):
+                self.set_changed(SYSTEM_STATS_KEY)
 
             self._system_data = {
                 INTERFACES_KEY: interfaces,
                 STATIC_DEVICES_KEY: devices,
                 UNKNOWN_DEVICES_KEY: unknown_devices,
                 SYSTEM_STATS_KEY: system_state,
+                DIAGNOSTICS_KEY: diagnostics,
                 ATTR_API_LAST_UPDATE: api_last_update,
                 ATTR_WEB_SOCKET_LAST_UPDATE: web_socket_last_update
             }
@@ -148,6 +256,13 @@ class EdgeOSData(object):
     def ws_handler(self, payload=None):
         try:
             if payload is not None:
+                if self._is_first_ws_frame and self._initialize_started is not None:
+                    self._is_first_ws_frame = False
+
+                    elapsed = perf_counter() - self._initialize_started
+
+                    _LOGGER.info(f'First WS frame received {elapsed:.3f} seconds after initialization started')
+
                 for key in payload:
                     _LOGGER.debug(f"Running parser of {key}")
 
@@ -226,7 +341,7 @@ class EdgeOSData(object):
 
                 static_mapping_data = subnet_item.get(STATIC_MAPPING, {})
                 for hostname in static_mapping_data:
-                    device = self.get_device(hostname)
+                    device = dict(self.get_device(hostname))
 
                     static_mapping_item = static_mapping_data[hostname]
                     ip = static_mapping_item.get(IP_ADDRESS)
@@ -244,28 +359,55 @@ class EdgeOSData(object):
 
     def load_interfaces(self, device_data):
         interfaces_data = device_data.get(INTERFACES_KEY, {})
-        ethernet_data = interfaces_data.get("ethernet", {})
 
-        for ethernet_key in ethernet_data:
-            ethernet_item = ethernet_data[ethernet_key]
-            description = ethernet_item.get("description")
+        for interface_type in interfaces_data:
+            interface_type_data = interfaces_data[interface_type]
 
-            name = ethernet_key
+            if not isinstance(interface_type_data, dict):
+                continue
 
-            if description is not None:
-                name = f"{ethernet_key} ({description})"
+            for interface_key in interface_type_data:
+                self.load_interface(interface_key, interface_type_data[interface_key])
 
-            interface = {
-                ATTR_NAME: name
-            }
+    def load_interface(self, interface_key, interface_item):
+        if not isinstance(interface_item, dict):
+            interface_item = {}
+
+        description = interface_item.get("description")
+
+        name = interface_key
+
+        if description is not None:
+            name = f"{interface_key} ({description})"
+
+        interface = {
+            ATTR_NAME: name
+        }
+
+        self.set_interface(interface_key, interface)
 
-            self.set_interface(ethernet_key, interface)
+        vif_data = interface_item.get(INTERFACE_VIF, {})
+
+        for vif_key in vif_data:
+            self.load_interface(f"{interface_key}.{vif_key}", vif_data[vif_key])
+
+        pppoe_data = interface_item.get(INTERFACE_PPPOE, {})
+
+        for pppoe_key in pppoe_data:
+            self.load_interface(f"{INTERFACE_PPPOE}{pppoe_key}", pppoe_data[pppoe_key])
 
     async def load_devices_data(self):
         try:
-            _LOGGER.debug('Getting devices by API')
+            devices_data = self._cached_devices_data
 
-            devices_data = await self._api.get_devices_data()
+            if devices_data is None:
+                _LOGGER.debug('Getting devices by API')
+
+                devices_data = await self._api.get_devices_data()
+            else:
+                _LOGGER.debug('Using devices data retrieved during the configuration')
+
+                self._cached_devices_data = None
 
             self.load_devices(devices_data)
             self.load_interfaces(devices_data)
@@ -333,38 +475,51 @@ class EdgeOSData(object):
         try:
             _LOGGER.debug(f'Handle {DISCOVER_KEY} data')
 
-            result = self.get_discover_data()
-
             if data is None or data == '':
                 _LOGGER.debug(f'{DISCOVER_KEY} is empty')
                 return
 
             devices_data = data.get(DEVICE_LIST, [])
+            neighbours = {}
 
             for device_data in devices_data:
-                for key in DISCOVER_DEVICE_ITEMS:
-                    device_data_item = device_data.get(key, {})
+                neighbour = self.get_neighbour(device_data)
+                mac = neighbour.get(MAC)
 
-                    if key == ADDRESS_LIST:
-                        discover_addresses = {}
+                if mac is None:
+                    _LOGGER.debug(f'Ignoring {DISCOVER_KEY} device without addresses: {device_data}')
 
-                        for address in device_data_item:
-                            hwaddr = address.get(ADDRESS_HWADDR)
-                            ipv4 = address.get(ADDRESS_IPV4)
+                    continue
 
-                            discover_addresses[hwaddr] = ipv4
+                neighbours[mac] = neighbour
 
-                        result[key] = discover_addresses
-                    else:
-                        result[key] = device_data_item
-
-            self.set_discover_data(result)
+            self.set_neighbours(neighbours)
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
             _LOGGER.error(f'Failed to load {DISCOVER_KEY}, Original Message: {data}, Error: {ex}, Line: {line_number}')
 
+    @staticmethod
+    def get_neighbour(device_data):
+        neighbour = {}
+
+        for key in DISCOVER_DEVICE_ITEMS:
+            neighbour[key] = device_data.get(key)
+
+        addresses = {}
+
+        for address in device_data.get(ADDRESS_LIST, []):
+            hwaddr = address.get(ADDRESS_HWADDR)
+
+            if hwaddr is not None:
+                addresses[hwaddr.lower()] = address.get(ADDRESS_IPV4)
+
+        neighbour[ADDRESS_LIST] = addresses
+        neighbour[MAC] = next(iter(addresses), None)
+
+        return neighbour
+
     @staticmethod
     def check_last_activity(device):
         date_minimum = datetime.fromtimestamp(0)
@@ -402,7 +557,8 @@ class EdgeOSData(object):
             updated_devices = []
 
             for device_key in all_devices:
-                device = self.get_device(device_key)
+                # Work on a copy so set_device can detect what changed
+                device = dict(self.get_device(device_key))
                 device_ip = device.get(IP)
                 device_data = data.get(device_ip)
 
@@ -448,13 +604,53 @@ class EdgeOSData(object):
 
                 self.set_device(hostname, device)
 
+            self.update()
+
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
             _LOGGER.error(f'Failed to load {EXPORT_KEY}, Error: {ex}, Line: {line_number}')
 
+    def set_changed(self, key, item_key=None):
+        for consumer in self._changes:
+            consumer_changes = self._changes[consumer]
+            changes = consumer_changes.get(key)
+
+            if changes is None:
+                changes = set()
+
+                consumer_changes[key] = changes
+
+            if item_key is not None:
+                changes.add(item_key)
+
+    def add_changes_consumer(self, consumer):
+        """Track the changes separately for another consumer, changes before it was added are not tracked."""
+        if consumer not in self._changes:
+            self._changes[consumer] = {}
+
+    def remove_changes_consumer(self, consumer):
+        self._changes.pop(consumer, None)
+
+    def is_changed(self, key, consumer=CHANGES_CONSUMER_ENTITIES):
+        return key in self._changes.get(consumer, {})
+
+    def pop_changes(self, consumer=CHANGES_CONSUMER_ENTITIES):
+        """Return the keys of source records changed since the previous call of the consumer, per data key."""
+        changes = self._changes.get(consumer)
+
+        if changes is None:
+            changes = {}
+        else:
+            self._changes[consumer] = {}
+
+        return changes
+
     def set_discover_data(self, discover_state):
+        if self._edgeos_data.get(DISCOVER_KEY) != discover_state:
+            self.set_changed(DISCOVER_KEY)
+
         self._edgeos_data[DISCOVER_KEY] = discover_state
 
         self.update()
@@ -464,7 +660,81 @@ class EdgeOSData(object):
 
         return result
 
+    def set_neighbours(self, neighbours):
+        """Replace the neighbour table, the router's own neighbour provides the discover data."""
+        neighbour_addresses = {}
+
+        for mac in neighbours:
+            neighbour = neighbours[mac]
+
+            for hwaddr in neighbour[ADDRESS_LIST]:
+                neighbour_addresses[hwaddr] = mac
+
+                ipv4 = neighbour[ADDRESS_LIST][hwaddr]
+
+                if ipv4 is not None:
+                    neighbour_addresses[ipv4] = mac
+
+        self._edgeos_data[NEIGHBOURS_KEY] = neighbours
+        self._neighbour_addresses = neighbour_addresses
+
+        own_neighbour = self.get_own_neighbour()
+
+        if own_neighbour is None:
+            # Keeps the discover data of the router from the previous messages
+            _LOGGER.debug(f'Router was not found within {len(neighbours)} neighbours')
+
+            self.update()
+        else:
+            discover_data = {}
+
+            for key in DISCOVER_DEVICE_ITEMS:
+                discover_data[key] = own_neighbour.get(key)
+
+            self.set_discover_data(discover_data)
+
+    def get_neighbours(self):
+        result = self._edgeos_data.get(NEIGHBOURS_KEY, {})
+
+        return result
+
+    def get_neighbour_by_address(self, address):
+        """Neighbour by any of its MAC or IPv4 addresses."""
+        neighbours = self.get_neighbours()
+        mac = self._neighbour_addresses.get(address.lower())
+
+        return neighbours.get(mac)
+
+    def get_own_neighbour(self):
+        """The router itself, by the configured host, by the MAC of one of its interfaces or as the only neighbour.
+
+        None when the router cannot be identified unambiguously, another device must not be taken for the router.
+        """
+        neighbours = self.get_neighbours()
+        neighbour_addresses = self._neighbour_addresses
+
+        mac = neighbour_addresses.get(self._host)
+
+        if mac is None:
+            interfaces = self.get_interfaces()
+
+            for interface_name in interfaces:
+                interface_mac = interfaces[interface_name].get(MAC)
+
+                if interface_mac is not None and interface_mac.lower() in neighbour_addresses:
+                    mac = neighbour_addresses[interface_mac.lower()]
+
+                    break
+
+        if mac is None and len(neighbours) == 1:
+            mac = next(iter(neighbours))
+
+        return neighbours.get(mac)
+
     def set_unknown_devices(self, unknown_devices):
+        if self._edgeos_data.get(UNKNOWN_DEVICES_KEY) != unknown_devices:
+            self.set_changed(UNKNOWN_DEVICES_KEY)
+
         self._edgeos_data[UNKNOWN_DEVICES_KEY] = unknown_devices
 
         self.update()
@@ -475,10 +745,32 @@ class EdgeOSData(object):
         return result
 
     def set_system_state(self, system_state):
+        if self._edgeos_data.get(SYSTEM_STATS_KEY) != system_state:
+            self.set_changed(SYSTEM_STATS_KEY)
+
         self._edgeos_data[SYSTEM_STATS_KEY] = system_state
 
         self.update()
 
+    def set_cached_devices_data(self, devices_data):
+        """Devices data to use instead of requesting it on the next load."""
+        self._cached_devices_data = devices_data
+
+    def set_diagnostics(self, diagnostics):
+        if diagnostics is None:
+            self._edgeos_data.pop(DIAGNOSTICS_KEY, None)
+        else:
+            self._edgeos_data[DIAGNOSTICS_KEY] = diagnostics
+
+        self.set_changed(DIAGNOSTICS_KEY)
+
+        self.update()
+
+    def get_diagnostics(self):
+        result = self._edgeos_data.get(DIAGNOSTICS_KEY)
+
+        return result
+
     def get_system_state(self):
         result = self._edgeos_data.get(SYSTEM_STATS_KEY, {})
 
@@ -492,8 +784,10 @@ class EdgeOSData(object):
 
         current_interface = all_interfaces[name]
 
-        for key in interface:
-            current_interface[key] = interface[key]
+        self.update_available_options(INTERFACES_KEY, current_interface, interface)
+
+        if self.merge_changes(current_interface, interface):
+            self.set_changed(INTERFACES_KEY, name)
 
     def get_interfaces(self):
         if INTERFACES_KEY not in self._edgeos_data:
@@ -525,8 +819,51 @@ class EdgeOSData(object):
 
         current_device = all_devices[hostname]
 
-        for key in device:
-            current_device[key] = device[key]
+        self.update_available_options(STATIC_DEVICES_KEY, current_device, device)
+
+        if self.merge_changes(current_device, device):
+            self.set_changed(STATIC_DEVICES_KEY, hostname)
+
+    def update_available_options(self, key, current_item, item):
+        """Drop the cached options of a data key once an item was added or renamed."""
+        if len(current_item) == 0 or (ATTR_NAME in item and current_item.get(ATTR_NAME) != item[ATTR_NAME]):
+            self._available_options.pop(key, None)
+
+    def get_available_options(self, key):
+        """(key, name) of all items of a data key sorted by name, cached until an item is added or renamed."""
+        available_options = self._available_options.get(key)
+
+        if available_options is None:
+            items = self._edgeos_data.get(key, {})
+            available_options = []
+
+            for item_key in items:
+                item_name = items[item_key].get(ATTR_NAME)
+
+                if item_name is None:
+                    item_name = item_key
+
+                available_options.append((item_key, item_name))
+
+            available_options.sort(key=lambda option: option[1].lower())
+
+            self._available_options[key] = available_options
+
+        return available_options
+
+    @staticmethod
+    def merge_changes(current_item, item):
+        is_changed = False
+
+        for key in item:
+            value = item[key]
+
+            if key not in current_item or current_item[key] != value:
+                current_item[key] = value
+
+                is_changed = True
+
+        return is_changed
 
     def get_device(self, hostname):
         devices = self.get_devices()
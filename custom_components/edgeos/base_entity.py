@@ -39,6 +39,8 @@ class EdgeOSEntity(Entity):
         """Initialize the EdgeOS Binary Sensor."""
         self._hass = hass
         self._entity = entity
+        self._attributes = None
+        self._attributes_entity = None
         self._remove_dispatcher = None
         self._ha = ha
         self._entity_manager = ha.entity_manager
@@ -73,16 +75,20 @@ class EdgeOSEntity(Entity):
 
     @property
     def device_state_attributes(self):
-        """Return true if the binary sensor is on."""
-        return self._entity.get(ENTITY_ATTRIBUTES, {})
+        """Return the state attributes, built once per entity update."""
+        if self._attributes_entity is not self._entity:
+            self._attributes = self._entity_manager.get_entity_attributes(self._entity)
+            self._attributes_entity = self._entity
+
+        return self._attributes
 
     async def async_added_to_hass(self):
         """Register callbacks."""
         _LOGGER.info(f"async_added_to_hass: {self.unique_id}")
 
-        async_dispatcher_connect(self._hass,
-                                 SIGNALS[self._current_domain],
-                                 self._schedule_immediate_update)
+        signal = self._entity_manager.get_entity_signal(self._current_domain, self.name)
+
+        self._remove_dispatcher = async_dispatcher_connect(self._hass, signal, self._schedule_immediate_update)
 
         self._entity_manager.set_entity_status(self._current_domain, self.name, ENTITY_STATUS_READY)
 
@@ -90,7 +96,10 @@ class EdgeOSEntity(Entity):
         if self._remove_dispatcher is not None:
             self._remove_dispatcher()
 
-    async def async_update_data(self):
+            self._remove_dispatcher = None
+
+    @callback
+    def update_data(self):
         if self._entity_manager is None:
             _LOGGER.debug(f"Cannot update {self._current_domain} - Entity Manager is None | {self.name}")
         else:
@@ -107,11 +116,11 @@ class EdgeOSEntity(Entity):
 
                 self._entity_manager.set_entity_status(self._current_domain, self.name, ENTITY_STATUS_READY)
 
-                self.async_schedule_update_ha_state(True)
+                self.async_schedule_update_ha_state()
 
     @callback
     def _schedule_immediate_update(self):
-        self.hass.async_add_job(self.async_update_data)
+        self.update_data()
 
 
 def _get_ha(hass, name):
@@ -1,5 +1,6 @@
 """Config flow to configure HPPrinter."""
 import logging
+import asyncio
 
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
@@ -9,35 +10,89 @@ from custom_components.edgeos.web_api import EdgeOSWebAPI
 from custom_components.edgeos.web_login import EdgeOSWebLogin, LoginException
 from . import EdgeOSHomeAssistant
 from .EdgeOSData import EdgeOSData
+from .item_selector import ItemSelector, parse_rules
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class EdgeOSConfigValidation:
+    """Validation of the submitted router, kept between the submits of a flow to reuse its session."""
+
     def __init__(self, hass):
         self._hass = hass
         self._auth_error = False
+        self._login_key = None
+        self._session_id = None
 
     async def edgeos_disconnection_handler(self):
         self._auth_error = True
 
     async def get_login_errors(self, user_input):
+        name = user_input.get(CONF_NAME)
+
+        try:
+            errors = await asyncio.wait_for(self.validate(user_input), CONFIG_VALIDATION_TIMEOUT)
+
+        except asyncio.TimeoutError:
+            _LOGGER.warning(f"Failed to validate EdgeOS ({name}) within {CONFIG_VALIDATION_TIMEOUT} seconds")
+
+            errors = {
+                "base": "timeout_error"
+            }
+
+        return errors
+
+    def set_validated_config(self, name, device_data):
+        """Keep the config downloaded during validation for the initial data of the new entry."""
+        validated_config = self._hass.data.get(DATA_EDGEOS_VALIDATED_CONFIG)
+
+        if validated_config is None:
+            validated_config = {}
+
+            self._hass.data[DATA_EDGEOS_VALIDATED_CONFIG] = validated_config
+
+        validated_config[name] = {
+            VALIDATED_CONFIG_DATA: device_data,
+            VALIDATED_CONFIG_TIMESTAMP: datetime.now()
+        }
+
+    async def login(self, login_api: EdgeOSWebLogin, login_key):
+        """Reuse the session of the previous submit for the same router and credentials, otherwise login."""
+        if self._session_id is not None and self._login_key == login_key:
+            if await login_api.use_session(self._session_id):
+                _LOGGER.debug(f"Reusing the session of the previous validation")
+
+                return True
+
+        self._session_id = None
+        self._login_key = login_key
+
+        is_logged_in = await login_api.login(throw_exception=True)
+
+        if is_logged_in:
+            self._session_id = login_api.session_id
+
+        return is_logged_in
+
+    async def validate(self, user_input):
         errors = None
         name = user_input.get(CONF_NAME)
         host = user_input.get(CONF_HOST)
         username = user_input.get(CONF_USERNAME)
         password = user_input.get(CONF_PASSWORD)
 
-        try:
-            login_api = EdgeOSWebLogin(host, username, password)
+        # Without a name the session is not persisted until the validation succeeded
+        login_api = EdgeOSWebLogin(self._hass, host, username, password)
+
+        edgeos_url = API_URL_TEMPLATE.format(host)
+        api = EdgeOSWebAPI(self._hass, edgeos_url, self.edgeos_disconnection_handler)
 
-            if login_api.login(throw_exception=True):
-                edgeos_url = API_URL_TEMPLATE.format(host)
-                api = EdgeOSWebAPI(self._hass, edgeos_url, self.edgeos_disconnection_handler)
-                cookies = login_api.cookies_data
+        try:
+            if await self.login(login_api, (host, username, password)):
+                cookie_jar = login_api.cookie_jar
 
-                await api.initialize(cookies)
+                await api.initialize(cookie_jar)
 
                 await api.heartbeat()
 
@@ -74,6 +129,14 @@ class EdgeOSConfigValidation:
                             "base": "invalid_export_configuration"
                         }
 
+                    if errors is None:
+                        self.set_validated_config(name, device_data)
+
+                        # Session is stored under the name of the entry, so the new entry will reuse it
+                        login_api.set_name(name)
+
+                        await login_api.save_session()
+
             else:
                 _LOGGER.warning(f"Failed to login EdgeOS ({name})")
 
@@ -95,6 +158,10 @@ class EdgeOSConfigValidation:
                 "base": "auth_general_error"
             }
 
+        finally:
+            await api.close()
+            await login_api.close()
+
         return errors
 
 
@@ -105,6 +172,9 @@ class EdgeOSFlowHandler(config_entries.ConfigFlow):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    def __init__(self):
+        self._config_validation = None
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -115,7 +185,8 @@ class EdgeOSFlowHandler(config_entries.ConfigFlow):
         """Handle a flow start."""
         _LOGGER.debug(f"Starting async_step_user of {DEFAULT_NAME}")
 
-        config_validation = EdgeOSConfigValidation(self.hass)
+        if self._config_validation is None:
+            self._config_validation = EdgeOSConfigValidation(self.hass)
 
         fields = {
             vol.Required(CONF_NAME, DEFAULT_NAME): str,
@@ -142,7 +213,7 @@ class EdgeOSFlowHandler(config_entries.ConfigFlow):
                                                 CONF_NAME: name
                                             })
 
-            errors = await config_validation.get_login_errors(user_input)
+            errors = await self._config_validation.get_login_errors(user_input)
 
             if errors is None:
                 return self.async_create_entry(
@@ -182,6 +253,7 @@ class EdgeOSOptionsFlowHandler(config_entries.OptionsFlow):
         self.options = {}
         self._data = {}
         self._config_validation = EdgeOSConfigValidation(self.hass)
+        self._filters = {}
 
         for key in config_entry.options.keys():
             self.options[key] = config_entry.options[key]
@@ -191,7 +263,30 @@ class EdgeOSOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the EdgeOS options."""
-        return await self.async_step_edge_os_additional_settings(user_input)
+        return await self.async_step_edge_os_filter(user_input)
+
+    async def async_step_edge_os_filter(self, user_input=None):
+        """Narrow down the interfaces / devices offered for selection."""
+        if user_input is not None:
+            for filter_key in [CONF_INTERFACES_FILTER, CONF_DEVICES_FILTER]:
+                self._filters[filter_key] = user_input.get(filter_key, EMPTY_STRING)
+
+            return await self.async_step_edge_os_additional_settings()
+
+        schema = vol.Schema(
+            {
+                vol.Optional(CONF_INTERFACES_FILTER, default=EMPTY_STRING): str,
+                vol.Optional(CONF_DEVICES_FILTER, default=EMPTY_STRING): str
+            }
+        )
+
+        return self.async_show_form(
+            step_id="edge_os_filter",
+            data_schema=schema,
+            description_placeholders={
+                CONF_NAME: self._data.get(CONF_NAME)
+            }
+        )
 
     def get_option(self, option_key):
         result = []
@@ -209,22 +304,47 @@ class EdgeOSOptionsFlowHandler(config_entries.OptionsFlow):
 
         return result
 
-    @staticmethod
-    def get_available_options(system_data, key):
-        all_items = system_data.get(key)
+    def get_rules(self, rules_key):
+        rules = parse_rules(self.options.get(rules_key))
+
+        return f"{RULES_SEPARATOR} ".join(rules)
+
+    def get_available_options(self, data_manager: EdgeOSData, key, filter_key, selected_items):
+        """Options of the items matching the filter, selected items are always offered."""
+        rules = parse_rules(self._filters.get(filter_key))
+        selector = None
+
+        if len(rules) > 0:
+            selector = ItemSelector(selected_items, rules)
 
         available_items = {
             OPTION_EMPTY: OPTION_EMPTY
         }
 
-        for item_key in all_items:
-            item = all_items[item_key]
-            item_name = item.get(CONF_NAME)
+        for item_key, item_name in data_manager.get_available_options(key):
+            if selector is None or selector.is_selected(item_key):
+                available_items[item_key] = item_name
 
-            available_items[item_key] = item_name
+        for item_key in selected_items:
+            if item_key not in available_items:
+                available_items[item_key] = item_key
 
         return available_items
 
+    def get_available_metrics(self, metrics_map):
+        unit = self._data.get(CONF_UNIT, ATTR_BYTE)
+
+        available_metrics = {
+            OPTION_EMPTY: OPTION_EMPTY
+        }
+
+        for metric in metrics_map:
+            metric_name = metrics_map[metric].get(ATTR_NAME).format(unit)
+
+            available_metrics[metric] = metric_name
+
+        return available_metrics
+
     @staticmethod
     def get_user_input_option(user_input, key):
         options = user_input.get(key, [])
@@ -241,31 +361,57 @@ class EdgeOSOptionsFlowHandler(config_entries.OptionsFlow):
             self.options[CONF_MONITORED_DEVICES] = self.get_user_input_option(user_input, CONF_MONITORED_DEVICES)
             self.options[CONF_MONITORED_INTERFACES] = self.get_user_input_option(user_input, CONF_MONITORED_INTERFACES)
             self.options[CONF_TRACK_DEVICES] = self.get_user_input_option(user_input, CONF_TRACK_DEVICES)
+            self.options[CONF_INTERFACE_METRICS] = self.get_user_input_option(user_input, CONF_INTERFACE_METRICS)
+            self.options[CONF_DEVICE_METRICS] = self.get_user_input_option(user_input, CONF_DEVICE_METRICS)
+            self.options[CONF_DIAGNOSTICS] = user_input.get(CONF_DIAGNOSTICS, False)
+            self.options[CONF_METRICS_ENDPOINT] = user_input.get(CONF_METRICS_ENDPOINT, False)
+
+            for rules_key in [CONF_MONITORED_DEVICES_RULES, CONF_MONITORED_INTERFACES_RULES, CONF_TRACK_DEVICES_RULES]:
+                self.options[rules_key] = parse_rules(user_input.get(rules_key))
 
             return self.async_create_entry(title="", data=self.options)
 
         monitored_devices = self.get_option(CONF_MONITORED_DEVICES)
         monitored_interfaces = self.get_option(CONF_MONITORED_INTERFACES)
         track_devices = self.get_option(CONF_TRACK_DEVICES)
+        interface_metrics = self.get_option(CONF_INTERFACE_METRICS)
+        device_metrics = self.get_option(CONF_DEVICE_METRICS)
 
         name = self._data.get(CONF_NAME)
 
         edgeos_data = self.hass.data[DATA_EDGEOS]
         ha: EdgeOSHomeAssistant = edgeos_data.get(name)
         data_manager: EdgeOSData = ha.data_manager
-        system_data = data_manager.system_data
+        all_interfaces = self.get_available_options(data_manager,
+                                                    INTERFACES_KEY,
+                                                    CONF_INTERFACES_FILTER,
+                                                    monitored_interfaces)
 
-        all_interfaces = self.get_available_options(system_data, INTERFACES_KEY)
-        all_devices = self.get_available_options(system_data, STATIC_DEVICES_KEY)
+        all_devices = self.get_available_options(data_manager,
+                                                 STATIC_DEVICES_KEY,
+                                                 CONF_DEVICES_FILTER,
+                                                 monitored_devices + track_devices)
 
         schema = vol.Schema(
             {
                 vol.Optional(CONF_MONITORED_DEVICES, default=monitored_devices):
                     cv.multi_select(all_devices),
+                vol.Optional(CONF_MONITORED_DEVICES_RULES,
+                             default=self.get_rules(CONF_MONITORED_DEVICES_RULES)): str,
                 vol.Optional(CONF_MONITORED_INTERFACES, default=monitored_interfaces):
                     cv.multi_select(all_interfaces),
+                vol.Optional(CONF_MONITORED_INTERFACES_RULES,
+                             default=self.get_rules(CONF_MONITORED_INTERFACES_RULES)): str,
                 vol.Optional(CONF_TRACK_DEVICES, default=track_devices):
                     cv.multi_select(all_devices),
+                vol.Optional(CONF_TRACK_DEVICES_RULES,
+                             default=self.get_rules(CONF_TRACK_DEVICES_RULES)): str,
+                vol.Optional(CONF_INTERFACE_METRICS, default=interface_metrics):
+                    cv.multi_select(self.get_available_metrics(INTERFACES_STATS_MAP)),
+                vol.Optional(CONF_DEVICE_METRICS, default=device_metrics):
+                    cv.multi_select(self.get_available_metrics(DEVICE_SERVICES_STATS_MAP)),
+                vol.Optional(CONF_DIAGNOSTICS, default=self.options.get(CONF_DIAGNOSTICS, False)): bool,
+                vol.Optional(CONF_METRICS_ENDPOINT, default=self.options.get(CONF_METRICS_ENDPOINT, False)): bool,
             }
         )
 
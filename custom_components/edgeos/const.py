@@ -18,6 +18,10 @@ VERSION = '2.0.0'
 
 DOMAIN = 'edgeos'
 DATA_EDGEOS = 'edgeos_data'
+DATA_EDGEOS_SCHEDULER = 'edgeos_scheduler'
+DATA_EDGEOS_VALIDATED_CONFIG = 'edgeos_validated_config'
+DATA_EDGEOS_PROFILER = 'edgeos_profiler'
+DATA_EDGEOS_METRICS_VIEW = 'edgeos_metrics_view'
 DEFAULT_NAME = 'EdgeOS'
 
 SIGNAL_UPDATE_BINARY_SENSOR = f"{DEFAULT_NAME}_{DOMAIN_BINARY_SENSOR}_SIGNLE_UPDATE"
@@ -43,6 +47,24 @@ CONF_MONITORED_DEVICES_CLEAR = f'{CONF_MONITORED_DEVICES}{CLEAR_SUFFIX}'
 CONF_TRACK_DEVICES = 'track_devices'
 CONF_TRACK_DEVICES_CLEAR = f'{CONF_TRACK_DEVICES}{CLEAR_SUFFIX}'
 CONF_UNIT = 'unit'
+CONF_INTERFACE_METRICS = 'interface_metrics'
+CONF_DEVICE_METRICS = 'device_metrics'
+CONF_DIAGNOSTICS = 'diagnostics'
+CONF_METRICS_ENDPOINT = 'metrics_endpoint'
+CONF_INTERFACES_FILTER = 'interfaces_filter'
+CONF_DEVICES_FILTER = 'devices_filter'
+
+RULES_SUFFIX = '_rules'
+CONF_MONITORED_INTERFACES_RULES = f'{CONF_MONITORED_INTERFACES}{RULES_SUFFIX}'
+CONF_MONITORED_DEVICES_RULES = f'{CONF_MONITORED_DEVICES}{RULES_SUFFIX}'
+CONF_TRACK_DEVICES_RULES = f'{CONF_TRACK_DEVICES}{RULES_SUFFIX}'
+
+RULE_EXCLUDE_PREFIX = '!'
+RULE_REGEX_PREFIX = 're:'
+RULES_SEPARATOR = ','
+RULES_ESCAPE = '\\'
+RULES_GROUP_OPEN = '([{'
+RULES_GROUP_CLOSE = ')]}'
 
 API_URL_TEMPLATE = 'https://{}'
 WEBSOCKET_URL_TEMPLATE = 'wss://{}/ws/stats'
@@ -54,6 +76,10 @@ EDGEOS_API_HEARTBREAT = 'heartbeat'
 
 COOKIE_PHPSESSID = 'PHPSESSID'
 
+STORAGE_VERSION = 1
+STORAGE_KEY_SESSION = f'{DOMAIN}.{{}}.session'
+STORAGE_LAST_VALIDATED = 'last_validated'
+
 DISCONNECTED_INTERVAL = 120
 
 TRUE_STR = 'true'
@@ -62,6 +88,8 @@ FALSE_STR = 'false'
 LINK_UP = 'up'
 
 INTERFACES_STATS = 'stats'
+INTERFACE_VIF = 'vif'
+INTERFACE_PPPOE = 'pppoe'
 
 BITS_IN_BYTE = 8
 BYTE = 1
@@ -74,6 +102,7 @@ ATTR_BYTE = 'Bytes'
 
 INTERFACES_KEY = 'interfaces'
 SYSTEM_STATS_KEY = 'system-stats'
+DIAGNOSTICS_KEY = 'diagnostics'
 EXPORT_KEY = 'export'
 STATIC_DEVICES_KEY = 'static-devices'
 DHCP_LEASES_KEY = 'dhcp-leases'
@@ -83,6 +112,7 @@ SYS_INFO_KEY = 'sys_info'
 NUM_ROUTES_KEY = 'num-routes'
 USERS_KEY = 'users'
 DISCOVER_KEY = 'discover'
+NEIGHBOURS_KEY = 'neighbours'
 UNKNOWN_DEVICES_KEY = 'unknown-devices'
 
 UPTIME = 'uptime'
@@ -118,6 +148,15 @@ RESPONSE_OUTPUT = 'output'
 RESPONSE_FAILURE_CODE = '0'
 
 HEARTBEAT_MAX_AGE = 15
+HEARTBEAT_SESSION = 'SESSION'
+
+LOGIN_SESSION_READY_TIMEOUT = 5
+LOGIN_SESSION_READY_INTERVAL = 0.25
+
+CONFIG_VALIDATION_TIMEOUT = 30
+VALIDATED_CONFIG_MAX_AGE = timedelta(minutes=5)
+VALIDATED_CONFIG_DATA = 'data'
+VALIDATED_CONFIG_TIMESTAMP = 'timestamp'
 
 API_URL_DATA_TEMPLATE = '{}?data={}'
 API_URL_HEARTBEAT_TEMPLATE = '{}?t={}'
@@ -145,30 +184,101 @@ INTERFACES_MAIN_MAP = {
     'mac': {ATTR_NAME: 'MAC'},
 }
 
+ATTR_STATE_CLASS = 'state_class'
+STATE_CLASS_MEASUREMENT = 'measurement'
+STATE_CLASS_TOTAL_INCREASING = 'total_increasing'
+
+UNIT_BYTES = 'Bytes'
+UNIT_BYTES_PER_SECOND = 'Bps'
+
+# Unit of measurement of metric sensors by the unit of the attribute, formatted with the configured unit
+METRIC_UNITS = {
+    UNIT_BYTES: '{}',
+    UNIT_BYTES_PER_SECOND: '{}/ps'
+}
+
 INTERFACES_STATS_MAP = {
-    'rx_packets': {ATTR_NAME: 'Packets (Received)'},
-    'tx_packets': {ATTR_NAME: 'Packets (Sent)'},
-    'rx_bytes': {ATTR_NAME: '{} (Received)', ATTR_UNIT_OF_MEASUREMENT: 'Bytes'},
-    'tx_bytes': {ATTR_NAME: '{} (Sent)', ATTR_UNIT_OF_MEASUREMENT: 'Bytes'},
-    'rx_errors': {ATTR_NAME: 'Errors (Received)'},
-    'tx_errors': {ATTR_NAME: 'Errors (Sent)'},
-    'rx_dropped': {ATTR_NAME: 'Dropped Packets (Received)'},
-    'tx_dropped': {ATTR_NAME: 'Dropped Packets (Sent)'},
-    'rx_bps': {ATTR_NAME: '{}/ps (Received)', ATTR_UNIT_OF_MEASUREMENT: 'Bps'},
-    'tx_bps': {ATTR_NAME: '{}/ps (Sent)', ATTR_UNIT_OF_MEASUREMENT: 'Bps'},
-    'multicast': {ATTR_NAME: 'Multicast'}
+    'rx_packets': {ATTR_NAME: 'Packets (Received)', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'tx_packets': {ATTR_NAME: 'Packets (Sent)', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'rx_bytes': {ATTR_NAME: '{} (Received)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES,
+                 ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'tx_bytes': {ATTR_NAME: '{} (Sent)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES,
+                 ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'rx_errors': {ATTR_NAME: 'Errors (Received)', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'tx_errors': {ATTR_NAME: 'Errors (Sent)', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'rx_dropped': {ATTR_NAME: 'Dropped Packets (Received)', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'tx_dropped': {ATTR_NAME: 'Dropped Packets (Sent)', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'rx_bps': {ATTR_NAME: '{}/ps (Received)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES_PER_SECOND,
+               ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    'tx_bps': {ATTR_NAME: '{}/ps (Sent)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES_PER_SECOND,
+               ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    'multicast': {ATTR_NAME: 'Multicast', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING}
 }
 
 DEVICE_SERVICES_STATS_MAP = {
-    'rx_bytes': {ATTR_NAME: '{} (Received)', ATTR_UNIT_OF_MEASUREMENT: 'Bytes'},
-    'tx_bytes': {ATTR_NAME: '{} (Sent)', ATTR_UNIT_OF_MEASUREMENT: 'Bytes'},
-    'rx_rate': {ATTR_NAME: '{}/ps (Received)', ATTR_UNIT_OF_MEASUREMENT: 'Bps'},
-    'tx_rate': {ATTR_NAME: '{}/ps (Sent)', ATTR_UNIT_OF_MEASUREMENT: 'Bps'},
+    'rx_bytes': {ATTR_NAME: '{} (Received)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES,
+                 ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'tx_bytes': {ATTR_NAME: '{} (Sent)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES,
+                 ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    'rx_rate': {ATTR_NAME: '{}/ps (Received)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES_PER_SECOND,
+                ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    'tx_rate': {ATTR_NAME: '{}/ps (Sent)', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES_PER_SECOND,
+                ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
 }
 
 SCAN_INTERVAL_WS_TIMEOUT = timedelta(seconds=60)
-SCAN_INTERVAL_ENTITIES = timedelta(seconds=1)
+ENTITIES_MAX_STALENESS = timedelta(minutes=5)
 SCAN_INTERVAL_API = timedelta(seconds=60)
+
+SCHEDULER_MAX_CONCURRENT_LOGINS = 2
+SCHEDULER_MAX_CONCURRENT_POLLS = 4
+SCHEDULER_LAG_WARNING = 10
+SCHEDULER_JOB_API = 'api'
+SCHEDULER_JOB_ENTITIES = 'entities'
+SCHEDULER_JOB_DIAGNOSTICS = 'diagnostics'
+SCHEDULER_JOB_PENDING_WRITES = 'pending-writes'
+
+CHANGES_CONSUMER_ENTITIES = 'entities'
+CHANGES_CONSUMER_METRICS = 'metrics'
+
+SCAN_INTERVAL_DIAGNOSTICS = timedelta(seconds=30)
+# Measuring the data size walks all the records, it is measured far less often than the counters are sampled
+SCAN_INTERVAL_DIAGNOSTICS_DATA_SIZE = timedelta(minutes=10)
+
+UNIT_MILLISECONDS = 'ms'
+UNIT_SECONDS = 's'
+UNIT_MESSAGES_PER_SECOND = 'msg/s'
+UNIT_WRITES_PER_SECOND = 'writes/s'
+
+DIAGNOSTICS_WS_MESSAGES_RATE = 'ws_messages_rate'
+DIAGNOSTICS_WS_DECODE_TIME = 'ws_decode_time'
+DIAGNOSTICS_ENTITIES_UPDATE_DURATION = 'entities_update_duration'
+DIAGNOSTICS_ENTITIES_WRITES_RATE = 'entities_writes_rate'
+DIAGNOSTICS_API_LATENCY = 'api_latency'
+DIAGNOSTICS_API_LAG = 'api_lag'
+DIAGNOSTICS_RECONNECTS = 'reconnects'
+DIAGNOSTICS_DATA_SIZE = 'data_size'
+DIAGNOSTICS_COUNTER_TIMESTAMP = 'timestamp'
+DIAGNOSTICS_COUNTER_API_REQUESTS = 'api_requests'
+
+DIAGNOSTICS_SENSORS = {
+    DIAGNOSTICS_WS_MESSAGES_RATE: {ATTR_NAME: 'WS Messages', ATTR_UNIT_OF_MEASUREMENT: UNIT_MESSAGES_PER_SECOND,
+                                   ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    DIAGNOSTICS_WS_DECODE_TIME: {ATTR_NAME: 'WS Decode Time', ATTR_UNIT_OF_MEASUREMENT: UNIT_MILLISECONDS,
+                                 ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    DIAGNOSTICS_ENTITIES_UPDATE_DURATION: {ATTR_NAME: 'Entities Update Duration',
+                                           ATTR_UNIT_OF_MEASUREMENT: UNIT_MILLISECONDS,
+                                           ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    DIAGNOSTICS_ENTITIES_WRITES_RATE: {ATTR_NAME: 'Entities Written', ATTR_UNIT_OF_MEASUREMENT: UNIT_WRITES_PER_SECOND,
+                                       ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    DIAGNOSTICS_API_LATENCY: {ATTR_NAME: 'API Latency', ATTR_UNIT_OF_MEASUREMENT: UNIT_MILLISECONDS,
+                              ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    DIAGNOSTICS_API_LAG: {ATTR_NAME: 'API Scheduling Lag', ATTR_UNIT_OF_MEASUREMENT: UNIT_SECONDS,
+                          ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT},
+    DIAGNOSTICS_RECONNECTS: {ATTR_NAME: 'Reconnects', ATTR_STATE_CLASS: STATE_CLASS_TOTAL_INCREASING},
+    DIAGNOSTICS_DATA_SIZE: {ATTR_NAME: 'Data Size', ATTR_UNIT_OF_MEASUREMENT: UNIT_BYTES,
+                            ATTR_STATE_CLASS: STATE_CLASS_MEASUREMENT}
+}
 EMPTY_LAST_VALID = datetime.fromtimestamp(100000)
 
 MAX_MSG_SIZE = 0
@@ -180,6 +290,10 @@ BEGINS_WITH_SIX_DIGITS = '^([0-9]{1,6})'
 
 SENSOR_TYPE_INTERFACE = 'Interface'
 SENSOR_TYPE_DEVICE = 'Device'
+SENSOR_TYPE_TRACKER = 'Tracker'
+SENSOR_TYPE_SYSTEM = 'System'
+SENSOR_TYPE_METRIC = 'Metric'
+SENSOR_TYPE_DIAGNOSTIC = 'Diagnostic'
 
 ATTR_SECONDS = 'seconds'
 ATTR_SYSTEM_UPTIME = 'System Uptime'
@@ -200,6 +314,13 @@ ENTITY_STATE = 'state'
 ENTITY_ATTRIBUTES = 'attributes'
 ENTITY_NAME = 'name'
 ENTITY_DEVICE_NAME = "device-name"
+ENTITY_TYPE = 'entity-type'
+ENTITY_RECORD = 'record'
+ENTITY_ATTRIBUTES_BUILDER = 'attributes-builder'
+ENTITY_LAST_CHANGED = 'last-changed'
+ENTITY_LAST_WRITE = 'last-write'
+ENTITY_UNIT = 'unit'
+ENTITY_STATE_CLASS = 'state-class'
 
 ENTITY_STATUS = 'entity-status'
 ENTITY_STATUS_EMPTY = None
@@ -209,9 +330,49 @@ ENTITY_STATUS_MODIFIED = f'{ENTITY_STATUS}-modified'
 ENTITY_STATUS_IGNORE = f'{ENTITY_STATUS}-ignore'
 ENTITY_STATUS_CANCELLED = f'{ENTITY_STATUS}-cancelled'
 
+DEADBAND_STATE = 'state'
+DEADBAND_ATTRIBUTES = 'attributes'
+DEADBAND_IGNORED_ATTRIBUTES = 'ignored-attributes'
+DEADBAND_VOLATILE_ATTRIBUTES = 'volatile-attributes'
+
+SYSTEM_STATS_CPU = 'cpu'
+SYSTEM_STATS_MEMORY = 'mem'
+
+# Relative change of numeric values (state and record items) below which a state write is suppressed,
+# changes of ignored record items alone never cause a state write,
+# changes of volatile record items (changing on almost every update) alone are written once the deadbands expired
+STATE_WRITE_DEADBANDS = {
+    SENSOR_TYPE_INTERFACE: {
+        DEADBAND_VOLATILE_ATTRIBUTES: list(INTERFACES_STATS_MAP.keys())
+    },
+    SENSOR_TYPE_DEVICE: {
+        DEADBAND_VOLATILE_ATTRIBUTES: list(DEVICE_SERVICES_STATS_MAP.keys()),
+        DEADBAND_IGNORED_ATTRIBUTES: [LAST_ACTIVITY]
+    },
+    SENSOR_TYPE_TRACKER: {
+        DEADBAND_IGNORED_ATTRIBUTES: [LAST_ACTIVITY]
+    },
+    SENSOR_TYPE_METRIC: {
+        DEADBAND_STATE: 0.01
+    },
+    SENSOR_TYPE_SYSTEM: {
+        DEADBAND_STATE: 0.01,
+        DEADBAND_VOLATILE_ATTRIBUTES: [SYSTEM_STATS_CPU, SYSTEM_STATS_MEMORY, UPTIME],
+        DEADBAND_IGNORED_ATTRIBUTES: [ATTR_API_LAST_UPDATE, ATTR_WEB_SOCKET_LAST_UPDATE]
+    }
+}
+
+# Changes within the deadbands are written once the previous write is older,
+# the relative deadband of steadily growing values (counters, uptime) keeps widening,
+# held back changes of records which stopped changing are written by a periodic job
+STATE_WRITE_DEADBAND_MAX_AGE = timedelta(minutes=1)
+SCAN_INTERVAL_PENDING_WRITES = timedelta(seconds=15)
+
 ICONS = {
     SENSOR_TYPE_INTERFACE: "mdi:network-router",
     SENSOR_TYPE_DEVICE: "mdi:devices",
+    SENSOR_TYPE_METRIC: "mdi:chart-line",
+    SENSOR_TYPE_DIAGNOSTIC: "mdi:gauge",
 }
 
 CONNECTED_ICONS = {
@@ -223,6 +384,28 @@ SERVICE_LOG_EVENTS_SCHEMA = vol.Schema({
     vol.Required(ATTR_ENABLED): cv.boolean,
 })
 
+ATTR_MODE = 'mode'
+ATTR_DURATION = 'duration'
+ATTR_TRACE_MEMORY = 'trace_memory'
+
+PROFILE_MODE_CPROFILE = 'cprofile'
+PROFILE_MODE_SAMPLING = 'sampling'
+PROFILE_MODES = [PROFILE_MODE_CPROFILE, PROFILE_MODE_SAMPLING]
+PROFILE_DEFAULT_DURATION = 30
+PROFILE_MAX_DURATION = 600
+PROFILE_SAMPLING_INTERVAL = 0.005
+PROFILE_TRACEMALLOC_FRAMES = 10
+PROFILE_REPORT_ITEMS = 40
+PROFILE_REPORT_TEMPLATE = 'edgeos_profile_{}_{}.txt'
+
+SERVICE_PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(CONF_NAME): cv.string,
+    vol.Optional(ATTR_MODE, default=PROFILE_MODE_CPROFILE): vol.In(PROFILE_MODES),
+    vol.Optional(ATTR_DURATION, default=PROFILE_DEFAULT_DURATION): vol.All(vol.Coerce(int),
+                                                                         vol.Range(min=1, max=PROFILE_MAX_DURATION)),
+    vol.Optional(ATTR_TRACE_MEMORY, default=False): cv.boolean,
+})
+
 HTTP_ERRORS = {
     404: "not_found",
     403: "invalid_credentials"
@@ -232,3 +415,85 @@ DOMAIN_LOAD = "load"
 DOMAIN_UNLOAD = "unload"
 
 OPTION_EMPTY = " NONE "
+
+METRICS_URL = '/api/edgeos/metrics'
+METRICS_VIEW_NAME = 'api:edgeos:metrics'
+METRICS_CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+METRICS_PREFIX = 'edgeos_'
+METRICS_COUNTER_SUFFIX = '_total'
+METRICS_EOF = '# EOF\n'
+METRICS_TYPE = 'type'
+METRICS_HELP = 'help'
+METRICS_TYPE_COUNTER = 'counter'
+METRICS_TYPE_GAUGE = 'gauge'
+METRICS_LABEL_ROUTER = 'router'
+METRICS_LABEL_INTERFACE = 'interface'
+METRICS_LABEL_DEVICE = 'device'
+METRICS_LABEL_POOL = 'pool'
+LEASE_POOL = 'pool'
+
+# OpenMetrics families by the key of the value within the router's data
+METRICS_INTERFACE = {
+    'rx_packets': {ATTR_NAME: 'interface_receive_packets', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                   METRICS_HELP: 'Packets received by the interface'},
+    'tx_packets': {ATTR_NAME: 'interface_transmit_packets', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                   METRICS_HELP: 'Packets sent by the interface'},
+    'rx_bytes': {ATTR_NAME: 'interface_receive_bytes', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                 METRICS_HELP: 'Bytes received by the interface'},
+    'tx_bytes': {ATTR_NAME: 'interface_transmit_bytes', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                 METRICS_HELP: 'Bytes sent by the interface'},
+    'rx_errors': {ATTR_NAME: 'interface_receive_errors', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                  METRICS_HELP: 'Receive errors of the interface'},
+    'tx_errors': {ATTR_NAME: 'interface_transmit_errors', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                  METRICS_HELP: 'Transmit errors of the interface'},
+    'rx_dropped': {ATTR_NAME: 'interface_receive_dropped_packets', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                   METRICS_HELP: 'Received packets dropped by the interface'},
+    'tx_dropped': {ATTR_NAME: 'interface_transmit_dropped_packets', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                   METRICS_HELP: 'Sent packets dropped by the interface'},
+    'multicast': {ATTR_NAME: 'interface_multicast_packets', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                  METRICS_HELP: 'Multicast packets of the interface'},
+    'rx_bps': {ATTR_NAME: 'interface_receive_rate', METRICS_TYPE: METRICS_TYPE_GAUGE,
+               METRICS_HELP: 'Receive rate of the interface as reported by the router'},
+    'tx_bps': {ATTR_NAME: 'interface_transmit_rate', METRICS_TYPE: METRICS_TYPE_GAUGE,
+               METRICS_HELP: 'Transmit rate of the interface as reported by the router'},
+    LINK_UP: {ATTR_NAME: 'interface_up', METRICS_TYPE: METRICS_TYPE_GAUGE,
+              METRICS_HELP: 'Whether the link of the interface is up'}
+}
+
+METRICS_DEVICE = {
+    'rx_bytes': {ATTR_NAME: 'device_receive_bytes', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                 METRICS_HELP: 'Bytes received by the device'},
+    'tx_bytes': {ATTR_NAME: 'device_transmit_bytes', METRICS_TYPE: METRICS_TYPE_COUNTER,
+                 METRICS_HELP: 'Bytes sent by the device'},
+    'rx_rate': {ATTR_NAME: 'device_receive_rate', METRICS_TYPE: METRICS_TYPE_GAUGE,
+                METRICS_HELP: 'Bytes per second received by the device'},
+    'tx_rate': {ATTR_NAME: 'device_transmit_rate', METRICS_TYPE: METRICS_TYPE_GAUGE,
+                METRICS_HELP: 'Bytes per second sent by the device'},
+    CONNECTED: {ATTR_NAME: 'device_connected', METRICS_TYPE: METRICS_TYPE_GAUGE,
+                METRICS_HELP: 'Whether the device was active recently'}
+}
+
+METRICS_SYSTEM = {
+    SYSTEM_STATS_CPU: {ATTR_NAME: 'cpu_usage_percent', METRICS_TYPE: METRICS_TYPE_GAUGE,
+                       METRICS_HELP: 'CPU usage of the router'},
+    SYSTEM_STATS_MEMORY: {ATTR_NAME: 'memory_usage_percent', METRICS_TYPE: METRICS_TYPE_GAUGE,
+                          METRICS_HELP: 'Memory usage of the router'},
+    UPTIME: {ATTR_NAME: 'uptime_seconds', METRICS_TYPE: METRICS_TYPE_GAUGE,
+             METRICS_HELP: 'Uptime of the router'},
+    IS_ALIVE: {ATTR_NAME: 'api_connected', METRICS_TYPE: METRICS_TYPE_GAUGE,
+               METRICS_HELP: 'Whether the API of the router is connected'}
+}
+
+METRICS_DHCP_LEASES = {ATTR_NAME: 'dhcp_leases', METRICS_TYPE: METRICS_TYPE_GAUGE,
+                       METRICS_HELP: 'DHCP leases per pool'}
+
+METRICS_DHCP_STATIC_MAPPINGS = {ATTR_NAME: 'dhcp_static_mappings', METRICS_TYPE: METRICS_TYPE_GAUGE,
+                                METRICS_HELP: 'DHCP static mappings'}
+
+METRICS_FAMILIES = [
+    *METRICS_INTERFACE.values(),
+    *METRICS_DEVICE.values(),
+    METRICS_DHCP_LEASES,
+    METRICS_DHCP_STATIC_MAPPINGS,
+    *METRICS_SYSTEM.values()
+]
@@ -13,6 +13,9 @@ class DeviceManager:
         self._ha = ha
 
         self._devices = {}
+        self._system_device_key = None
+        self._pending_registry_updates = {}
+        self._registry_update_task = None
 
         self._data_manager = self._ha.data_manager
 
@@ -41,9 +44,13 @@ class DeviceManager:
         self._devices[name] = device_info
 
     def update(self):
+        if DEFAULT_NAME in self._devices and not self._data_manager.is_changed(DISCOVER_KEY):
+            return
+
         self.generate_system_device()
 
     def generate_system_device(self):
+        """Recreate the system device only when hostname, product or firmware changed."""
         try:
             discover_data = self._data_manager.get_discover_data()
 
@@ -56,6 +63,13 @@ class DeviceManager:
 
                 return
 
+            system_device_key = (hostname, product, version)
+
+            if system_device_key == self._system_device_key:
+                return
+
+            self._system_device_key = system_device_key
+
             current_device_info = self.get(DEFAULT_NAME)
 
             device_name = f"{MANUFACTURER} {product} {hostname}"
@@ -70,13 +84,58 @@ class DeviceManager:
                 "sw_version": version
             }
 
-            if current_device_info.get("name", "") != device_name:
+            if len(current_device_info) == 0:
                 _LOGGER.info(f"{DEFAULT_NAME} device created: {device_info}")
 
-                self.set(DEFAULT_NAME, device_info)
+            else:
+                _LOGGER.info(f"{DEFAULT_NAME} device changed: {device_info}")
+
+                self.schedule_registry_update(DEFAULT_NAME, current_device_info, device_info)
+
+            self.set(DEFAULT_NAME, device_info)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
             _LOGGER.error(f'Failed to generate system device, Error: {ex}, Line: {line_number}')
+
+    def schedule_registry_update(self, name, previous_device_info, device_info):
+        """Queue the change of a registered device, queued changes are written by a single task."""
+        pending_update = self._pending_registry_updates.get(name)
+
+        if pending_update is None:
+            identifiers = previous_device_info.get("identifiers", set())
+        else:
+            # Still registered by the identifiers from before the earlier queued change
+            identifiers = pending_update[0]
+
+        self._pending_registry_updates[name] = (identifiers, device_info)
+
+        if self._registry_update_task is None or self._registry_update_task.done():
+            self._registry_update_task = self._hass.async_create_task(self.async_update_registry())
+
+    async def async_update_registry(self):
+        device_reg = await dr.async_get_registry(self._hass)
+
+        pending_registry_updates = self._pending_registry_updates
+        self._pending_registry_updates = {}
+
+        for name in pending_registry_updates:
+            identifiers, device_info = pending_registry_updates[name]
+
+            device = device_reg.async_get_device(identifiers, set())
+
+            if device is None:
+                continue
+
+            new_identifiers = device_info.get("identifiers")
+
+            if new_identifiers == identifiers:
+                new_identifiers = None
+
+            device_reg.async_update_device(device.id,
+                                           name=device_info.get("name"),
+                                           model=device_info.get("model"),
+                                           sw_version=device_info.get("sw_version"),
+                                           new_identifiers=new_identifiers)
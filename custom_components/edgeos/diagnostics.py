@@ -0,0 +1,123 @@
+import sys
+import logging
+from time import perf_counter
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_size(data, seen=None):
+    """Approximate memory held by nested dicts / lists, each object counted once."""
+    if seen is None:
+        seen = set()
+
+    if id(data) in seen:
+        return 0
+
+    seen.add(id(data))
+
+    size = sys.getsizeof(data)
+
+    if isinstance(data, dict):
+        for key in data:
+            size += _get_size(key, seen) + _get_size(data[key], seen)
+
+    elif isinstance(data, (list, tuple, set)):
+        for item in data:
+            size += _get_size(item, seen)
+
+    return size
+
+
+def _get_rate(current, previous, elapsed):
+    rate = None
+
+    if previous is not None and elapsed > 0:
+        rate = round((current - previous) / elapsed, 2)
+
+    return rate
+
+
+def _get_average_ms(total_time, previous_total_time, count, previous_count):
+    average = None
+
+    if previous_count is not None and count > previous_count:
+        average = round((total_time - previous_total_time) * 1000 / (count - previous_count), 3)
+
+    return average
+
+
+class EdgeOSDiagnostics:
+    """Samples the counters of a router into the values of its diagnostic sensors.
+
+    Counters are incremented along the hot paths,
+    rates and averages are calculated over the time since the previous sample.
+    """
+
+    def __init__(self, ha):
+        self._ha = ha
+        self._previous = {}
+        self._data_size = None
+        self._data_size_measured = None
+
+    def get_data_size(self, now):
+        """Size of the router's data, measured again once SCAN_INTERVAL_DIAGNOSTICS_DATA_SIZE passed."""
+        data_size_age = None
+
+        if self._data_size_measured is not None:
+            data_size_age = now - self._data_size_measured
+
+        if data_size_age is None or data_size_age >= SCAN_INTERVAL_DIAGNOSTICS_DATA_SIZE.total_seconds():
+            self._data_size = _get_size(self._ha.data_manager.edgeos_data)
+            self._data_size_measured = now
+
+        return self._data_size
+
+    def sample(self):
+        data_manager = self._ha.data_manager
+        entity_manager = self._ha.entity_manager
+        web_socket = data_manager.web_socket
+        api = data_manager.api
+
+        now = perf_counter()
+        previous = self._previous
+
+        counters = {
+            DIAGNOSTICS_COUNTER_TIMESTAMP: now,
+            DIAGNOSTICS_WS_MESSAGES_RATE: web_socket.messages_received,
+            DIAGNOSTICS_WS_DECODE_TIME: web_socket.decode_time,
+            DIAGNOSTICS_ENTITIES_WRITES_RATE: entity_manager.state_writes,
+            DIAGNOSTICS_API_LATENCY: api.request_time,
+            DIAGNOSTICS_COUNTER_API_REQUESTS: api.requests
+        }
+
+        elapsed = now - previous.get(DIAGNOSTICS_COUNTER_TIMESTAMP, now)
+
+        lag = self._ha.api_lag
+        update_duration = entity_manager.last_update_duration
+
+        diagnostics = {
+            DIAGNOSTICS_WS_MESSAGES_RATE: _get_rate(counters[DIAGNOSTICS_WS_MESSAGES_RATE],
+                                                    previous.get(DIAGNOSTICS_WS_MESSAGES_RATE),
+                                                    elapsed),
+            DIAGNOSTICS_WS_DECODE_TIME: _get_average_ms(counters[DIAGNOSTICS_WS_DECODE_TIME],
+                                                        previous.get(DIAGNOSTICS_WS_DECODE_TIME),
+                                                        counters[DIAGNOSTICS_WS_MESSAGES_RATE],
+                                                        previous.get(DIAGNOSTICS_WS_MESSAGES_RATE)),
+            DIAGNOSTICS_ENTITIES_UPDATE_DURATION: round(update_duration * 1000, 3),
+            DIAGNOSTICS_ENTITIES_WRITES_RATE: _get_rate(counters[DIAGNOSTICS_ENTITIES_WRITES_RATE],
+                                                        previous.get(DIAGNOSTICS_ENTITIES_WRITES_RATE),
+                                                        elapsed),
+            DIAGNOSTICS_API_LATENCY: _get_average_ms(counters[DIAGNOSTICS_API_LATENCY],
+                                                     previous.get(DIAGNOSTICS_API_LATENCY),
+                                                     counters[DIAGNOSTICS_COUNTER_API_REQUESTS],
+                                                     previous.get(DIAGNOSTICS_COUNTER_API_REQUESTS)),
+            DIAGNOSTICS_API_LAG: None if lag is None else round(lag, 3),
+            DIAGNOSTICS_RECONNECTS: data_manager.reconnect_count,
+            DIAGNOSTICS_DATA_SIZE: self.get_data_size(now)
+        }
+
+        self._previous = counters
+
+        return diagnostics
@@ -1,12 +1,15 @@
 import sys
 import logging
+from time import perf_counter
 
 from homeassistant.components.device_tracker import ATTR_SOURCE_TYPE, SOURCE_TYPE_ROUTER
 
 from homeassistant.const import ATTR_FRIENDLY_NAME
-from homeassistant.helpers.entity_registry import EntityRegistry
+from homeassistant.core import callback
+from homeassistant.helpers.entity_registry import EntityRegistry, EVENT_ENTITY_REGISTRY_UPDATED
 
 from .EdgeOSData import EdgeOSData
+from .item_selector import ItemSelector, parse_rules
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,6 +21,77 @@ def _get_camera_binary_sensor_key(topic, event_type):
     return key
 
 
+def _compile_attribute_schema(attributes_map, unit, unit_size):
+    """Resolve display name and conversion factor (None when no unit) of each attribute."""
+    schema = {}
+
+    for key in attributes_map:
+        attr = attributes_map[key]
+        name = attr.get(ATTR_NAME, key)
+        factor = None
+
+        if ATTR_UNIT_OF_MEASUREMENT in attr:
+            name = name.format(unit)
+            factor = BITS_IN_BYTE / unit_size
+
+        schema[key] = (name, factor)
+
+    return schema
+
+
+def _compile_metric_schema(attributes_map, unit, unit_size):
+    """Resolve display name, unit of measurement, conversion factor and state class of each metric.
+
+    Unlike the attributes, the states are converted from the reported bytes to the unit they are labelled with.
+    """
+    schema = {}
+    attributes_schema = _compile_attribute_schema(attributes_map, unit, unit_size)
+
+    for key in attributes_map:
+        attr = attributes_map[key]
+        name, factor = attributes_schema[key]
+        unit_of_measurement = None
+
+        if ATTR_UNIT_OF_MEASUREMENT in attr:
+            unit_of_measurement = METRIC_UNITS[attr[ATTR_UNIT_OF_MEASUREMENT]].format(unit)
+            factor = 1 / unit_size
+
+        schema[key] = (name, unit_of_measurement, factor, attr.get(ATTR_STATE_CLASS))
+
+    return schema
+
+
+def _to_number(value):
+    result = None
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        result = value
+
+    elif isinstance(value, str):
+        try:
+            result = float(value)
+        except ValueError:
+            result = None
+
+    return result
+
+
+def _is_within_deadband(previous_value, value, deadband):
+    if previous_value == value:
+        return True
+
+    if deadband <= 0:
+        return False
+
+    previous_number = _to_number(previous_value)
+    number = _to_number(value)
+
+    if previous_number is None or number is None:
+        return False
+
+    return abs(number - previous_number) <= abs(previous_number) * deadband
+
+
 class EntityManager:
     def __init__(self, hass, ha):
         self._hass = hass
@@ -25,12 +99,47 @@ class EntityManager:
 
         self._entities = {}
 
-        self._allowed_interfaces = []
-        self._allowed_devices = []
-        self._allowed_track_devices = []
+        self._allowed_interfaces = ItemSelector()
+        self._allowed_devices = ItemSelector()
+        self._allowed_track_devices = ItemSelector()
+
+        self._interface_metrics = []
+        self._device_metrics = []
 
         self._options = None
 
+        self._is_full_rebuild_required = True
+        self._changed_entities = set()
+        self._seen_entities = set()
+        self._updated_entities = set()
+        self._pending_entities = {}
+        self._state_writes = 0
+        self._suppressed_writes = 0
+        self._last_update_rebuilt = 0
+        self._last_update_duration = 0
+        self._rebuild_count = 0
+        self._entities_added = 0
+
+        self._entity_ids = {}
+        self._unique_ids = {}
+        self._remove_entity_registry_listener = None
+
+        self._interface_attributes = _compile_attribute_schema({**INTERFACES_MAIN_MAP, **INTERFACES_STATS_MAP},
+                                                               self._ha.unit,
+                                                               self._ha.unit_size)
+
+        self._device_attributes = _compile_attribute_schema(DEVICE_SERVICES_STATS_MAP,
+                                                            self._ha.unit,
+                                                            self._ha.unit_size)
+
+        self._interface_metrics_schema = _compile_metric_schema(INTERFACES_STATS_MAP,
+                                                                self._ha.unit,
+                                                                self._ha.unit_size)
+
+        self._device_metrics_schema = _compile_metric_schema(DEVICE_SERVICES_STATS_MAP,
+                                                             self._ha.unit,
+                                                             self._ha.unit_size)
+
         self._data_manager: EdgeOSData = self._ha.data_manager
         self._domain_component_manager: dict = {}
 
@@ -45,6 +154,88 @@ class EntityManager:
     def entity_registry(self) -> EntityRegistry:
         return self._ha.entity_registry
 
+    @property
+    def rebuild_count(self):
+        return self._rebuild_count
+
+    @property
+    def last_update_duration(self):
+        return self._last_update_duration
+
+    @property
+    def entities_added(self):
+        return self._entities_added
+
+    @property
+    def state_writes(self):
+        return self._state_writes
+
+    @property
+    def suppressed_writes(self):
+        return self._suppressed_writes
+
+    def initialize_entity_ids(self):
+        """Load the entity ids of this integration and keep them current from registry events."""
+        for entity_id in list(self.entity_registry.entities):
+            self.set_entity_id(entity_id)
+
+        self._remove_entity_registry_listener = self._hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED,
+                                                                            self.handle_entity_registry_updated)
+
+    def remove_entity_ids(self):
+        if self._remove_entity_registry_listener is not None:
+            self._remove_entity_registry_listener()
+
+            self._remove_entity_registry_listener = None
+
+        self._entity_ids = {}
+        self._unique_ids = {}
+
+    def set_entity_id(self, entity_id):
+        registry_entry = self.entity_registry.async_get(entity_id)
+
+        if registry_entry is not None and registry_entry.platform == DOMAIN:
+            key = (registry_entry.domain, registry_entry.unique_id)
+
+            self._entity_ids[key] = entity_id
+            self._unique_ids[entity_id] = key
+
+    def delete_entity_id(self, entity_id):
+        key = self._unique_ids.pop(entity_id, None)
+
+        if key is not None and self._entity_ids.get(key) == entity_id:
+            del self._entity_ids[key]
+
+    def get_entity_id(self, domain, unique_id):
+        return self._entity_ids.get((domain, unique_id))
+
+    @callback
+    def handle_entity_registry_updated(self, event):
+        action = event.data.get("action")
+        entity_id = event.data.get("entity_id")
+        old_entity_id = event.data.get("old_entity_id")
+
+        if old_entity_id is not None:
+            self.delete_entity_id(old_entity_id)
+
+        if action == "remove":
+            self.delete_entity_id(entity_id)
+        else:
+            self.set_entity_id(entity_id)
+
+    def get_entity_signal(self, domain, name):
+        signal = f"{SIGNALS[domain]}_{self._ha.integration_name}_{name}"
+
+        return signal
+
+    def pop_updated_entities(self):
+        """Return the (domain, name) of entities modified since the previous call."""
+        updated_entities = self._updated_entities
+
+        self._updated_entities = set()
+
+        return updated_entities
+
     def set_domain_component(self, domain, async_add_entities, component):
         self._domain_component_manager[domain] = {
             "async_add_entities": async_add_entities,
@@ -70,9 +261,22 @@ class EntityManager:
 
         self._options = options
 
-        self._allowed_interfaces = self.get_option(CONF_MONITORED_INTERFACES)
-        self._allowed_devices = self.get_option(CONF_MONITORED_DEVICES)
-        self._allowed_track_devices = self.get_option(CONF_TRACK_DEVICES)
+        self._allowed_interfaces = ItemSelector(self.get_option(CONF_MONITORED_INTERFACES),
+                                                parse_rules(options.get(CONF_MONITORED_INTERFACES_RULES)))
+
+        self._allowed_devices = ItemSelector(self.get_option(CONF_MONITORED_DEVICES),
+                                             parse_rules(options.get(CONF_MONITORED_DEVICES_RULES)))
+
+        self._allowed_track_devices = ItemSelector(self.get_option(CONF_TRACK_DEVICES),
+                                                   parse_rules(options.get(CONF_TRACK_DEVICES_RULES)))
+
+        self._interface_metrics = self.get_option(CONF_INTERFACE_METRICS)
+        self._device_metrics = self.get_option(CONF_DEVICE_METRICS)
+
+        self._is_full_rebuild_required = True
+
+    def request_full_rebuild(self):
+        self._is_full_rebuild_required = True
 
     def clear_entities(self, domain):
         self._entities[domain] = {}
@@ -102,10 +306,73 @@ class EntityManager:
         if domain in self._entities and name in self._entities[domain]:
             del self._entities[domain][name]
 
+        self._pending_entities.pop((domain, name), None)
+
+    @staticmethod
+    def is_entity_changed(current_entity, entity, is_deadband_expired=False):
+        deadbands = STATE_WRITE_DEADBANDS.get(entity.get(ENTITY_TYPE), {})
+
+        state_deadband = deadbands.get(DEADBAND_STATE, 0)
+        attributes_deadband = deadbands.get(DEADBAND_ATTRIBUTES, 0)
+        ignored_attributes = deadbands.get(DEADBAND_IGNORED_ATTRIBUTES, [])
+        volatile_attributes = deadbands.get(DEADBAND_VOLATILE_ATTRIBUTES, [])
+
+        if is_deadband_expired:
+            state_deadband = 0
+            attributes_deadband = 0
+
+        if current_entity.get(ENTITY_ICON) != entity.get(ENTITY_ICON):
+            return True
+
+        if not _is_within_deadband(current_entity.get(ENTITY_STATE), entity.get(ENTITY_STATE), state_deadband):
+            return True
+
+        current_record = current_entity.get(ENTITY_RECORD, {})
+        record = entity.get(ENTITY_RECORD, {})
+
+        if current_record.keys() != record.keys():
+            return True
+
+        for key in record:
+            if key in ignored_attributes:
+                continue
+
+            if key in volatile_attributes and not is_deadband_expired:
+                continue
+
+            if not _is_within_deadband(current_record[key], record[key], attributes_deadband):
+                return True
+
+        return False
+
     def set_entity(self, domain, name, data):
         if domain not in self._entities:
             self._entities[domain] = {}
 
+        self._seen_entities.add((domain, name))
+
+        current_entity = self._entities[domain].get(name)
+        now = datetime.now()
+
+        if current_entity is not None:
+            last_write = current_entity.get(ENTITY_LAST_WRITE)
+            is_deadband_expired = last_write is None or now - last_write >= STATE_WRITE_DEADBAND_MAX_AGE
+
+            if not self.is_entity_changed(current_entity, data, is_deadband_expired):
+                self._suppressed_writes += 1
+
+                if is_deadband_expired:
+                    self._pending_entities.pop((domain, name), None)
+                else:
+                    # Held back, written by flush_pending_entities when the record does not change again
+                    self._pending_entities[(domain, name)] = data
+
+                return
+
+        self._pending_entities.pop((domain, name), None)
+
+        data[ENTITY_LAST_WRITE] = now
+
         status = self.get_entity_status(domain, name)
 
         self._entities[domain][name] = data
@@ -117,6 +384,39 @@ class EntityManager:
 
         self.set_entity_status(domain, name, status)
 
+        self._changed_entities.add((domain, name))
+        self._last_update_rebuilt += 1
+
+    def flush_pending_entities(self):
+        """Write the changes held back by a deadband once the written state reached the maximum age."""
+        try:
+            now = datetime.now()
+            pending_entities = self._pending_entities
+
+            self._pending_entities = {}
+
+            for domain, name in pending_entities:
+                current_entity = self.get_entities(domain).get(name)
+
+                if current_entity is None:
+                    continue
+
+                if now - current_entity.get(ENTITY_LAST_WRITE, now) < STATE_WRITE_DEADBAND_MAX_AGE:
+                    self._pending_entities[(domain, name)] = pending_entities[(domain, name)]
+
+                    continue
+
+                self.set_entity(domain, name, pending_entities[(domain, name)])
+
+            if len(self._changed_entities) > 0:
+                self.reconcile(False)
+
+            self._changed_entities = set()
+            self._seen_entities = set()
+
+        except Exception as ex:
+            self.log_exception(ex, 'Failed to flush pending entities')
+
     def create_components(self):
         system_state = self.system_data.get(SYSTEM_STATS_KEY)
         api_last_update = self.system_data.get(ATTR_API_LAST_UPDATE)
@@ -128,50 +428,133 @@ class EntityManager:
         self.create_unknown_devices_sensor()
         self.create_uptime_sensor(system_state, api_last_update, web_socket_last_update)
         self.create_system_status_binary_sensor(system_state, api_last_update, web_socket_last_update)
+        self.create_diagnostic_sensors()
+
+    def create_changed_components(self, changes):
+        if SYSTEM_STATS_KEY in changes:
+            system_state = self.system_data.get(SYSTEM_STATS_KEY)
+            api_last_update = self.system_data.get(ATTR_API_LAST_UPDATE)
+            web_socket_last_update = self.system_data.get(ATTR_WEB_SOCKET_LAST_UPDATE)
+
+            self.create_uptime_sensor(system_state, api_last_update, web_socket_last_update)
+            self.create_system_status_binary_sensor(system_state, api_last_update, web_socket_last_update)
+
+        if UNKNOWN_DEVICES_KEY in changes:
+            self.create_unknown_devices_sensor()
+
+        if DIAGNOSTICS_KEY in changes:
+            self.create_diagnostic_sensors()
+
+        interfaces = self.system_data.get(INTERFACES_KEY, {})
+
+        for interface in changes.get(INTERFACES_KEY, []):
+            interface_data = interfaces.get(interface, {})
+
+            self.create_interface_binary_sensor(interface, interface_data)
+            self.create_interface_metric_sensors(interface, interface_data)
+
+        devices = self.system_data.get(STATIC_DEVICES_KEY, {})
+
+        for hostname in changes.get(STATIC_DEVICES_KEY, []):
+            host_data = devices.get(hostname, {})
+
+            self.create_device_binary_sensor(hostname, host_data)
+            self.create_device_metric_sensors(hostname, host_data)
+            self.create_device_tracker(hostname, host_data)
 
     def update(self):
+        """Rebuild the entities of changed source records, all entities after options were updated."""
         try:
             for domain in SIGNALS:
-                for entity_key in self.get_entities(domain):
-                    self.set_entity_status(domain, entity_key, ENTITY_STATUS_IGNORE)
+                if domain not in self._domain_component_manager:
+                    _LOGGER.debug(f"Skipping update, {domain} is not loaded yet")
+
+                    return
+
+            started = perf_counter()
 
-            self.create_components()
+            changes = self._data_manager.pop_changes()
+            is_full_rebuild = self._is_full_rebuild_required
 
+            self._is_full_rebuild_required = False
+            self._last_update_rebuilt = 0
+
+            if is_full_rebuild:
+                self.create_components()
+            else:
+                self.create_changed_components(changes)
+
+            self.reconcile(is_full_rebuild)
+
+            self._changed_entities = set()
+            self._seen_entities = set()
+            self._rebuild_count += self._last_update_rebuilt
+            self._last_update_duration = perf_counter() - started
+
+            _LOGGER.debug(f"Entities updated, Full: {is_full_rebuild}, Rebuilt: {self._last_update_rebuilt}, "
+                          f"Duration: {self._last_update_duration * 1000:.3f}ms, "
+                          f"State writes: {self._state_writes}, Suppressed: {self._suppressed_writes}")
+
+        except Exception as ex:
+            self.log_exception(ex, 'Failed to update')
+
+    def reconcile(self, is_full_rebuild):
+        """Add created entities, after a full rebuild also remove the entities which were not rebuilt."""
+        entities_to_add = {}
+        entities_to_remove = []
+
+        if is_full_rebuild:
             for domain in SIGNALS:
-                entities_to_add = []
-                domain_component_manager = self._domain_component_manager[domain]
-                domain_component = domain_component_manager["component"]
-                async_add_entities = domain_component_manager["async_add_entities"]
+                for entity_key in self.get_entities(domain):
+                    if (domain, entity_key) not in self._seen_entities:
+                        entities_to_remove.append((domain, entity_key))
 
-                entities = dict(self.get_entities(domain))
+        for domain, entity_key in self._changed_entities:
+            entity = self.get_entity(domain, entity_key)
+            status = entity.get(ENTITY_STATUS)
 
-                for entity_key in entities:
-                    entity = entities[entity_key]
-                    status = self.get_entity_status(domain, entity_key)
-                    name = entity.get(ENTITY_NAME)
-                    unique_id = f"{DEFAULT_NAME}-{domain}-{name}"
+            if status == ENTITY_STATUS_MODIFIED:
+                self._state_writes += 1
+                self._updated_entities.add((domain, entity_key))
 
-                    entity_id = self.entity_registry.async_get_entity_id(domain, DOMAIN, unique_id)
+            elif status == ENTITY_STATUS_CREATED:
+                name = entity.get(ENTITY_NAME)
+                unique_id = f"{DEFAULT_NAME}-{domain}-{name}"
 
-                    if status == ENTITY_STATUS_IGNORE:
-                        self.set_entity_status(domain, entity_key, ENTITY_STATUS_CANCELLED)
+                entity_id = self.get_entity_id(domain, unique_id)
 
-                        self.entity_registry.async_remove(entity_id)
+                domain_component = self._domain_component_manager[domain]["component"]
+                entity_component = domain_component(self._hass, self._ha, entity)
 
-                        self.delete_entity(domain, entity_key)
-                    elif status == ENTITY_STATUS_CREATED:
-                        entity_component = domain_component(self._hass, self._ha, entity)
+                if entity_id is not None:
+                    entity_component.entity_id = entity_id
 
-                        if not entity_id:
-                            entity_component.entity_id = entity_id
+                if domain not in entities_to_add:
+                    entities_to_add[domain] = []
 
-                        entities_to_add.append(entity_component)
+                entities_to_add[domain].append(entity_component)
 
-                if len(entities_to_add) > 0:
-                    async_add_entities(entities_to_add, True)
+        for domain, entity_key in entities_to_remove:
+            name = self.get_entity(domain, entity_key).get(ENTITY_NAME)
+            unique_id = f"{DEFAULT_NAME}-{domain}-{name}"
 
-        except Exception as ex:
-            self.log_exception(ex, 'Failed to update')
+            entity_id = self.get_entity_id(domain, unique_id)
+
+            self.set_entity_status(domain, entity_key, ENTITY_STATUS_CANCELLED)
+
+            self._updated_entities.discard((domain, entity_key))
+
+            if entity_id is not None:
+                self.entity_registry.async_remove(entity_id)
+
+            self.delete_entity(domain, entity_key)
+
+        for domain in entities_to_add:
+            async_add_entities = self._domain_component_manager[domain]["async_add_entities"]
+
+            async_add_entities(entities_to_add[domain], True)
+
+            self._entities_added += len(entities_to_add[domain])
 
     def create_device_trackers(self):
         try:
@@ -193,6 +576,7 @@ class EntityManager:
                 host_data = devices.get(hostname, {})
 
                 self.create_device_binary_sensor(hostname, host_data)
+                self.create_device_metric_sensors(hostname, host_data)
 
         except Exception as ex:
             self.log_exception(ex, 'Failed to updated devices')
@@ -205,62 +589,45 @@ class EntityManager:
                 interface_data = interfaces.get(interface)
 
                 self.create_interface_binary_sensor(interface, interface_data)
+                self.create_interface_metric_sensors(interface, interface_data)
 
         except Exception as ex:
             self.log_exception(ex, f'Failed to update {INTERFACES_KEY}')
 
     def create_interface_binary_sensor(self, key, data):
         self.create_binary_sensor(key, data, self._allowed_interfaces, SENSOR_TYPE_INTERFACE,
-                                  LINK_UP, self.get_interface_attributes)
+                                  LINK_UP, self.build_interface_attributes)
 
     def create_device_binary_sensor(self, key, data):
         self.create_binary_sensor(key, data, self._allowed_devices, SENSOR_TYPE_DEVICE,
-                                  CONNECTED, self.get_device_attributes)
+                                  CONNECTED, self.build_device_attributes)
 
-    def create_binary_sensor(self, key, data, allowed_items, sensor_type, main_attribute, get_attributes):
+    def create_binary_sensor(self, key, data, allowed_items, sensor_type, main_attribute, attributes_builder):
         try:
             if key in allowed_items:
                 entity_name = f'{DEFAULT_NAME} {sensor_type} {key}'
 
                 main_entity_details = data.get(main_attribute, FALSE_STR)
 
-                attributes = {
-                    ATTR_DEVICE_CLASS: DEVICE_CLASS_CONNECTIVITY,
-                    ATTR_FRIENDLY_NAME: entity_name
-                }
-
-                for data_item_key in data:
-                    if data_item_key != main_attribute:
-                        value = data.get(data_item_key)
-                        attr = get_attributes(data_item_key)
-
-                        name = attr.get(ATTR_NAME, data_item_key)
-                        unit_of_measurement = attr.get(ATTR_UNIT_OF_MEASUREMENT)
-
-                        if unit_of_measurement is None:
-                            attributes[name] = value
-                        else:
-                            name = name.format(self._ha.unit)
-
-                            attributes[name] = (int(value) * BITS_IN_BYTE) / self._ha.unit_size
-
                 is_on = str(main_entity_details).lower() == TRUE_STR
 
                 entities = self.get_entities(DOMAIN_BINARY_SENSOR)
                 current_entity = entities.get(entity_name)
 
-                attributes[ATTR_LAST_CHANGED] = datetime.now().strftime(DEFAULT_DATE_FORMAT)
-
                 if current_entity is not None and current_entity.get(ENTITY_STATE) == is_on:
-                    entity_attributes = current_entity.get(ENTITY_ATTRIBUTES, {})
-                    attributes[ATTR_LAST_CHANGED] = entity_attributes.get(ATTR_LAST_CHANGED)
+                    last_changed = current_entity.get(ENTITY_LAST_CHANGED)
+                else:
+                    last_changed = datetime.now()
 
                 entity = {
                     ENTITY_NAME: entity_name,
                     ENTITY_STATE: is_on,
-                    ENTITY_ATTRIBUTES: attributes,
+                    ENTITY_RECORD: dict(data),
+                    ENTITY_ATTRIBUTES_BUILDER: attributes_builder,
+                    ENTITY_LAST_CHANGED: last_changed,
                     ENTITY_ICON: ICONS[sensor_type],
-                    ENTITY_DEVICE_NAME: DEFAULT_NAME
+                    ENTITY_DEVICE_NAME: DEFAULT_NAME,
+                    ENTITY_TYPE: sensor_type
                 }
 
                 self.set_entity(DOMAIN_BINARY_SENSOR, entity_name, entity)
@@ -268,6 +635,48 @@ class EntityManager:
         except Exception as ex:
             self.log_exception(ex, f'Failed to create {key} sensor {sensor_type} with the following data: {data}')
 
+    def create_interface_metric_sensors(self, key, data):
+        self.create_metric_sensors(key, data, self._allowed_interfaces, SENSOR_TYPE_INTERFACE,
+                                   self._interface_metrics, self._interface_metrics_schema)
+
+    def create_device_metric_sensors(self, key, data):
+        self.create_metric_sensors(key, data, self._allowed_devices, SENSOR_TYPE_DEVICE,
+                                   self._device_metrics, self._device_metrics_schema)
+
+    def create_metric_sensors(self, key, data, allowed_items, sensor_type, metrics, metrics_schema):
+        try:
+            if len(metrics) == 0 or key not in allowed_items:
+                return
+
+            for metric in metrics:
+                if metric not in metrics_schema or metric not in data:
+                    continue
+
+                name, unit_of_measurement, factor, state_class = metrics_schema[metric]
+
+                entity_name = f'{DEFAULT_NAME} {sensor_type} {key} {name}'
+
+                state = _to_number(data[metric])
+
+                if state is not None and factor is not None:
+                    state = state * factor
+
+                entity = {
+                    ENTITY_NAME: entity_name,
+                    ENTITY_STATE: state,
+                    ENTITY_UNIT: unit_of_measurement,
+                    ENTITY_STATE_CLASS: state_class,
+                    ENTITY_ATTRIBUTES_BUILDER: self.build_metric_attributes,
+                    ENTITY_ICON: ICONS[SENSOR_TYPE_METRIC],
+                    ENTITY_DEVICE_NAME: DEFAULT_NAME,
+                    ENTITY_TYPE: SENSOR_TYPE_METRIC
+                }
+
+                self.set_entity(DOMAIN_SENSOR, entity_name, entity)
+
+        except Exception as ex:
+            self.log_exception(ex, f'Failed to create {key} metric sensors {sensor_type} with the following data: {data}')
+
     def create_unknown_devices_sensor(self):
         unknown_devices = self.system_data.get(UNKNOWN_DEVICES_KEY)
 
@@ -278,15 +687,13 @@ class EntityManager:
             if state < 1:
                 unknown_devices = None
 
-            attributes = {
-                ATTR_FRIENDLY_NAME: entity_name,
-                ATTR_UNKNOWN_DEVICES:  unknown_devices
-            }
-
             entity = {
                 ENTITY_NAME: entity_name,
                 ENTITY_STATE: state,
-                ENTITY_ATTRIBUTES: attributes,
+                ENTITY_RECORD: {
+                    ATTR_UNKNOWN_DEVICES: unknown_devices
+                },
+                ENTITY_ATTRIBUTES_BUILDER: self.build_unknown_devices_attributes,
                 ENTITY_ICON: "mdi:help-rhombus",
                 ENTITY_DEVICE_NAME: DEFAULT_NAME
             }
@@ -295,31 +702,60 @@ class EntityManager:
         except Exception as ex:
             self.log_exception(ex, f'Failed to create unknown device sensor, Data: {unknown_devices}')
 
-    def create_uptime_sensor(self, system_state, api_last_update, web_socket_last_update):
+    def create_diagnostic_sensors(self):
+        diagnostics = self.system_data.get(DIAGNOSTICS_KEY)
+
         try:
-            entity_name = f'{DEFAULT_NAME} {ATTR_SYSTEM_UPTIME}'
+            if diagnostics is None:
+                return
 
-            state = system_state.get(UPTIME, 0)
-            attributes = {}
+            for key in DIAGNOSTICS_SENSORS:
+                sensor_details = DIAGNOSTICS_SENSORS[key]
 
-            if system_state is not None:
-                attributes = {
-                    ATTR_UNIT_OF_MEASUREMENT: ATTR_SECONDS,
-                    ATTR_FRIENDLY_NAME: entity_name,
-                    ATTR_API_LAST_UPDATE: api_last_update.strftime(DEFAULT_DATE_FORMAT),
-                    ATTR_WEB_SOCKET_LAST_UPDATE: web_socket_last_update.strftime(DEFAULT_DATE_FORMAT)
+                entity_name = f'{DEFAULT_NAME} {SENSOR_TYPE_DIAGNOSTIC} {sensor_details.get(ATTR_NAME)}'
+
+                entity = {
+                    ENTITY_NAME: entity_name,
+                    ENTITY_STATE: diagnostics.get(key),
+                    ENTITY_UNIT: sensor_details.get(ATTR_UNIT_OF_MEASUREMENT),
+                    ENTITY_STATE_CLASS: sensor_details.get(ATTR_STATE_CLASS),
+                    ENTITY_ATTRIBUTES_BUILDER: self.build_metric_attributes,
+                    ENTITY_ICON: ICONS[SENSOR_TYPE_DIAGNOSTIC],
+                    ENTITY_DEVICE_NAME: DEFAULT_NAME,
+                    ENTITY_TYPE: SENSOR_TYPE_DIAGNOSTIC
                 }
 
-                for key in system_state:
-                    if key != UPTIME:
-                        attributes[key] = system_state[key]
+                self.set_entity(DOMAIN_SENSOR, entity_name, entity)
+
+        except Exception as ex:
+            self.log_exception(ex, f'Failed to create diagnostic sensors, Data: {diagnostics}')
+
+    @staticmethod
+    def get_system_record(system_state, api_last_update, web_socket_last_update):
+        record = {}
+
+        if system_state is not None:
+            record = dict(system_state)
+
+            record[ATTR_API_LAST_UPDATE] = api_last_update
+            record[ATTR_WEB_SOCKET_LAST_UPDATE] = web_socket_last_update
+
+        return record
+
+    def create_uptime_sensor(self, system_state, api_last_update, web_socket_last_update):
+        try:
+            entity_name = f'{DEFAULT_NAME} {ATTR_SYSTEM_UPTIME}'
+
+            state = system_state.get(UPTIME, 0)
 
             entity = {
                 ENTITY_NAME: entity_name,
                 ENTITY_STATE: state,
-                ENTITY_ATTRIBUTES: attributes,
+                ENTITY_RECORD: self.get_system_record(system_state, api_last_update, web_socket_last_update),
+                ENTITY_ATTRIBUTES_BUILDER: self.build_uptime_attributes,
                 ENTITY_ICON: "mdi:timer-sand",
-                ENTITY_DEVICE_NAME: DEFAULT_NAME
+                ENTITY_DEVICE_NAME: DEFAULT_NAME,
+                ENTITY_TYPE: SENSOR_TYPE_SYSTEM
             }
 
             self.set_entity(DOMAIN_SENSOR, entity_name, entity)
@@ -330,29 +766,19 @@ class EntityManager:
         try:
             entity_name = f'{DEFAULT_NAME} {ATTR_SYSTEM_STATUS}'
 
-            attributes = {}
             is_alive = False
 
             if system_state is not None:
-                attributes = {
-                    ATTR_DEVICE_CLASS: DEVICE_CLASS_CONNECTIVITY,
-                    ATTR_FRIENDLY_NAME: entity_name,
-                    ATTR_API_LAST_UPDATE: api_last_update.strftime(DEFAULT_DATE_FORMAT),
-                    ATTR_WEB_SOCKET_LAST_UPDATE: web_socket_last_update.strftime(DEFAULT_DATE_FORMAT)
-                }
-
-                for key in system_state:
-                    if key != IS_ALIVE:
-                        attributes[key] = system_state[key]
-
                 is_alive = system_state.get(IS_ALIVE, False)
 
             entity = {
                 ENTITY_NAME: entity_name,
                 ENTITY_STATE: is_alive,
-                ENTITY_ATTRIBUTES: attributes,
+                ENTITY_RECORD: self.get_system_record(system_state, api_last_update, web_socket_last_update),
+                ENTITY_ATTRIBUTES_BUILDER: self.build_system_status_attributes,
                 ENTITY_ICON: CONNECTED_ICONS[is_alive],
-                ENTITY_DEVICE_NAME: DEFAULT_NAME
+                ENTITY_DEVICE_NAME: DEFAULT_NAME,
+                ENTITY_TYPE: SENSOR_TYPE_SYSTEM
             }
 
             self.set_entity(DOMAIN_BINARY_SENSOR, entity_name, entity)
@@ -368,25 +794,13 @@ class EntityManager:
 
                 state = self._data_manager.is_device_online(host)
 
-                attributes = {
-                    ATTR_SOURCE_TYPE: SOURCE_TYPE_ROUTER,
-                    CONF_HOST: host
-                }
-
-                for data_item_key in data:
-                    value = data.get(data_item_key)
-                    attr = self.get_device_attributes(data_item_key)
-
-                    name = attr.get(ATTR_NAME, data_item_key)
-
-                    if ATTR_UNIT_OF_MEASUREMENT not in attr:
-                        attributes[name] = value
-
                 entity = {
                     ENTITY_NAME: entity_name,
                     ENTITY_STATE: state,
-                    ENTITY_ATTRIBUTES: attributes,
-                    ENTITY_DEVICE_NAME: DEFAULT_NAME
+                    ENTITY_RECORD: self.get_tracker_record(host, data),
+                    ENTITY_ATTRIBUTES_BUILDER: self.build_tracker_attributes,
+                    ENTITY_DEVICE_NAME: DEFAULT_NAME,
+                    ENTITY_TYPE: SENSOR_TYPE_TRACKER
                 }
 
                 self.set_entity(DOMAIN_DEVICE_TRACKER, entity_name, entity)
@@ -395,18 +809,134 @@ class EntityManager:
             self.log_exception(ex, f'Failed to create {host} device tracker with the following data: {data}')
 
     @staticmethod
-    def get_device_attributes(key):
-        result = DEVICE_SERVICES_STATS_MAP.get(key, {})
+    def get_entity_attributes(entity):
+        """Materialize the state attributes of an entity from its record."""
+        attributes = {}
+        attributes_builder = entity.get(ENTITY_ATTRIBUTES_BUILDER)
 
-        return result
+        if attributes_builder is not None:
+            attributes = attributes_builder(entity)
+
+        return attributes
 
     @staticmethod
-    def get_interface_attributes(key):
-        all_attributes = {**INTERFACES_MAIN_MAP, **INTERFACES_STATS_MAP}
+    def build_connectivity_attributes(entity, main_attribute, attributes_schema):
+        record = entity.get(ENTITY_RECORD, {})
+        last_changed = entity.get(ENTITY_LAST_CHANGED)
 
-        result = all_attributes.get(key, {})
+        attributes = {
+            ATTR_DEVICE_CLASS: DEVICE_CLASS_CONNECTIVITY,
+            ATTR_FRIENDLY_NAME: entity.get(ENTITY_NAME)
+        }
 
-        return result
+        for data_item_key in record:
+            if data_item_key != main_attribute:
+                value = record[data_item_key]
+                name, factor = attributes_schema.get(data_item_key, (data_item_key, None))
+
+                if factor is None:
+                    attributes[name] = value
+                else:
+                    number = _to_number(value)
+
+                    # Stats the router did not report are left out
+                    if number is not None:
+                        attributes[name] = int(number) * factor
+
+        if last_changed is not None:
+            attributes[ATTR_LAST_CHANGED] = last_changed.strftime(DEFAULT_DATE_FORMAT)
+
+        return attributes
+
+    def build_interface_attributes(self, entity):
+        return self.build_connectivity_attributes(entity, LINK_UP, self._interface_attributes)
+
+    def build_device_attributes(self, entity):
+        return self.build_connectivity_attributes(entity, CONNECTED, self._device_attributes)
+
+    def get_tracker_record(self, host, data):
+        """Items of the device exposed by its tracker, traffic is left out so it does not cause writes."""
+        device_attributes = self._device_attributes
+
+        record = {}
+
+        for data_item_key in data:
+            name, factor = device_attributes.get(data_item_key, (data_item_key, None))
+
+            if factor is None:
+                record[data_item_key] = data[data_item_key]
+
+        record[CONF_HOST] = host
+
+        return record
+
+    def build_tracker_attributes(self, entity):
+        record = entity.get(ENTITY_RECORD, {})
+        device_attributes = self._device_attributes
+
+        attributes = {
+            ATTR_SOURCE_TYPE: SOURCE_TYPE_ROUTER
+        }
+
+        for data_item_key in record:
+            name, factor = device_attributes.get(data_item_key, (data_item_key, None))
+
+            attributes[name] = record[data_item_key]
+
+        return attributes
+
+    @staticmethod
+    def build_metric_attributes(entity):
+        attributes = {
+            ATTR_FRIENDLY_NAME: entity.get(ENTITY_NAME)
+        }
+
+        return attributes
+
+    @staticmethod
+    def build_unknown_devices_attributes(entity):
+        record = entity.get(ENTITY_RECORD, {})
+
+        attributes = {
+            ATTR_FRIENDLY_NAME: entity.get(ENTITY_NAME),
+            ATTR_UNKNOWN_DEVICES: record.get(ATTR_UNKNOWN_DEVICES)
+        }
+
+        return attributes
+
+    @staticmethod
+    def build_system_attributes(entity, main_attribute, attributes):
+        record = entity.get(ENTITY_RECORD, {})
+
+        if len(record) == 0:
+            return {}
+
+        attributes[ATTR_FRIENDLY_NAME] = entity.get(ENTITY_NAME)
+
+        for key in record:
+            if key != main_attribute:
+                value = record[key]
+
+                if isinstance(value, datetime):
+                    value = value.strftime(DEFAULT_DATE_FORMAT)
+
+                attributes[key] = value
+
+        return attributes
+
+    def build_uptime_attributes(self, entity):
+        attributes = {
+            ATTR_UNIT_OF_MEASUREMENT: ATTR_SECONDS
+        }
+
+        return self.build_system_attributes(entity, UPTIME, attributes)
+
+    def build_system_status_attributes(self, entity):
+        attributes = {
+            ATTR_DEVICE_CLASS: DEVICE_CLASS_CONNECTIVITY
+        }
+
+        return self.build_system_attributes(entity, IS_ALIVE, attributes)
 
     @staticmethod
     def log_exception(ex, message):
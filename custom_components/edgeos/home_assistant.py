@@ -5,17 +5,22 @@ https://home-assistant.io/components/edgeos/
 """
 import sys
 import logging
+import asyncio
+from time import perf_counter
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_registry import async_get_registry, EntityRegistry
 
-from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .device_manager import DeviceManager
 from .entity_manager import EntityManager
 from .EdgeOSData import EdgeOSData
+from .scheduler import get_scheduler
+from .diagnostics import EdgeOSDiagnostics
+from .profiler import EdgeOSProfiler
+from .metrics import EdgeOSMetrics, EdgeOSMetricsView
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,26 +36,40 @@ class EdgeOSHomeAssistant:
         self._unit = entry.data.get(CONF_UNIT, ATTR_BYTE)
         self._unit_size = ALLOWED_UNITS.get(self._unit, BYTE)
 
-        self._remove_async_track_time_api = None
-        self._remove_async_track_time_entities = None
+        self._scheduler = get_scheduler(self._hass)
+        self._api_job_key = (self._integration_name, SCHEDULER_JOB_API)
+        self._entities_job_key = (self._integration_name, SCHEDULER_JOB_ENTITIES)
+        self._diagnostics_job_key = (self._integration_name, SCHEDULER_JOB_DIAGNOSTICS)
+        self._pending_writes_job_key = (self._integration_name, SCHEDULER_JOB_PENDING_WRITES)
 
-        self._is_first_time_online = True
+        self._last_entities_update = None
+        self._init_started = None
+        self._is_first_entity = True
         self._is_initialized = False
         self._is_ready = False
 
         self._entity_registry = None
 
-        self._data_manager = EdgeOSData(self._hass, self._config_entry.data, self.update)
+        self._data_manager = EdgeOSData(self._hass,
+                                        self._config_entry.data,
+                                        self.update,
+                                        self._scheduler.login_semaphore)
         self._device_manager = DeviceManager(self._hass, self)
         self._entity_manager = EntityManager(self._hass, self)
+        self._diagnostics = EdgeOSDiagnostics(self)
+        self._metrics = None
+
+        self.load_validated_config()
 
         self._services = {
             "save_debug_data": self.service_save_debug_data,
-            "log_events": self.service_log_events
+            "log_events": self.service_log_events,
+            "profile": self.service_profile
         }
 
         self._service_schema = {
-            "log_events": SERVICE_LOG_EVENTS_SCHEMA
+            "log_events": SERVICE_LOG_EVENTS_SCHEMA,
+            "profile": SERVICE_PROFILE_SCHEMA
         }
 
     @property
@@ -65,10 +84,22 @@ class EdgeOSHomeAssistant:
     def device_manager(self) -> DeviceManager:
         return self._device_manager
 
+    @property
+    def metrics(self) -> EdgeOSMetrics:
+        return self._metrics
+
     @property
     def entity_registry(self) -> EntityRegistry:
         return self._entity_registry
 
+    @property
+    def integration_name(self):
+        return self._integration_name
+
+    @property
+    def api_lag(self):
+        return self._scheduler.get_lag(self._api_job_key)
+
     @property
     def unit(self):
         return self._unit
@@ -78,22 +109,16 @@ class EdgeOSHomeAssistant:
         return self._unit_size
 
     async def async_init(self):
-        def internal_async_init(now):
-            self._hass.async_create_task(self._async_init(now))
+        _LOGGER.debug(f"Initializing EdgeOS")
 
-        self._entity_registry = await async_get_registry(self._hass)
+        self._init_started = perf_counter()
 
-        async_call_later(self._hass, 2, internal_async_init)
-
-    async def _async_init(self, now):
-        _LOGGER.debug(f"Initializing EdgeOS @{now}")
+        self._entity_registry = await async_get_registry(self._hass)
 
+        self._entity_manager.initialize_entity_ids()
         self._entity_manager.update_options(self._config_entry.options)
 
-        load = self._hass.config_entries.async_forward_entry_setup
-
-        for domain in SIGNALS:
-            self._hass.async_create_task(load(self._config_entry, domain))
+        self._hass.async_create_task(self.async_setup_platforms())
 
         # Register Service
         for service_name in self._services:
@@ -102,41 +127,54 @@ class EdgeOSHomeAssistant:
 
             self._hass.services.async_register(DOMAIN, service_name, service_callback, schema=service_schema)
 
-        def update_api(internal_now):
-            self._hass.async_create_task(self.async_update_api(internal_now))
-
-        def update_entities(internal_now):
-            self._hass.async_create_task(self.async_update_entities(internal_now))
-
         self._hass.async_create_task(self._data_manager.initialize())
 
-        self._hass.async_create_task(self.async_update_api(datetime.now()))
+        self._scheduler.register(self._api_job_key, SCAN_INTERVAL_API, self.async_update_api, True)
 
-        self._remove_async_track_time_api = async_track_time_interval(self._hass,
-                                                                      update_api,
-                                                                      SCAN_INTERVAL_API)
+        if ENTITIES_MAX_STALENESS is not None:
+            self._scheduler.register(self._entities_job_key,
+                                     ENTITIES_MAX_STALENESS,
+                                     self.async_check_entities_staleness)
 
-        self._remove_async_track_time_entities = async_track_time_interval(self._hass,
-                                                                           update_entities,
-                                                                           SCAN_INTERVAL_ENTITIES)
+        self._scheduler.register(self._pending_writes_job_key,
+                                 SCAN_INTERVAL_PENDING_WRITES,
+                                 self.async_flush_pending_entities)
+
+        self.update_diagnostics_job()
+        self.update_metrics()
 
         self._is_initialized = True
 
+    async def async_setup_platforms(self):
+        load = self._hass.config_entries.async_forward_entry_setup
+
+        await asyncio.gather(*[load(self._config_entry, domain) for domain in SIGNALS])
+
+        _LOGGER.debug(f'Platforms loaded after {perf_counter() - self._init_started:.3f} seconds')
+
+        # Entities of data received while the platforms were loading
+        self._data_manager.update(True)
+
     async def async_remove(self):
         _LOGGER.debug(f"async_remove called")
 
+        self._scheduler.unregister(self._api_job_key)
+        self._scheduler.unregister(self._entities_job_key)
+        self._scheduler.unregister(self._diagnostics_job_key)
+        self._scheduler.unregister(self._pending_writes_job_key)
+
+        if self._metrics is not None:
+            self._metrics.close()
+            self._metrics = None
+
         await self._data_manager.terminate()
 
+        self._entity_manager.remove_entity_ids()
+
         # Unregister Service
         for service_name in self._services:
             self._hass.services.async_remove(DOMAIN, service_name)
 
-        if self._remove_async_track_time_api is not None:
-            self._remove_async_track_time_api()
-
-        if self._remove_async_track_time_entities is not None:
-            self._remove_async_track_time_entities()
-
         unload = self._hass.config_entries.async_forward_entry_unload
 
         for domain in SIGNALS:
@@ -152,6 +190,9 @@ class EdgeOSHomeAssistant:
 
         self._entity_manager.update_options(entry.options)
 
+        self.update_diagnostics_job()
+        self.update_metrics()
+
         self._data_manager.update(True)
 
         await self.discover_all()
@@ -166,26 +207,94 @@ class EdgeOSHomeAssistant:
 
         await self._data_manager.refresh()
 
-    async def async_update_entities(self, event_time):
-        if not self._is_initialized:
-            _LOGGER.info(f'NOT INITIALIZED, cannot update entities: {event_time}')
+    def load_validated_config(self):
+        """Reuse the config downloaded while the entry was created by the config flow."""
+        validated_configs = self._hass.data.get(DATA_EDGEOS_VALIDATED_CONFIG, {})
+        validated_config = validated_configs.pop(self._integration_name, None)
+
+        if validated_config is not None:
+            age = datetime.now() - validated_config.get(VALIDATED_CONFIG_TIMESTAMP)
+
+            if age < VALIDATED_CONFIG_MAX_AGE:
+                self._data_manager.set_cached_devices_data(validated_config.get(VALIDATED_CONFIG_DATA))
+
+    def update_diagnostics_job(self):
+        if self._config_entry.options.get(CONF_DIAGNOSTICS, False):
+            self._scheduler.register(self._diagnostics_job_key,
+                                     SCAN_INTERVAL_DIAGNOSTICS,
+                                     self.async_update_diagnostics)
+
+        else:
+            self._scheduler.unregister(self._diagnostics_job_key)
+
+            if self._data_manager.get_diagnostics() is not None:
+                self._data_manager.set_diagnostics(None)
+
+    def update_metrics(self):
+        if self._config_entry.options.get(CONF_METRICS_ENDPOINT, False):
+            if self._metrics is None:
+                self._metrics = EdgeOSMetrics(self._data_manager, self._integration_name)
+
+            # Views cannot be removed, a single view serves the routers with the endpoint enabled
+            if DATA_EDGEOS_METRICS_VIEW not in self._hass.data:
+                metrics_view = EdgeOSMetricsView()
+
+                self._hass.http.register_view(metrics_view)
+
+                self._hass.data[DATA_EDGEOS_METRICS_VIEW] = metrics_view
 
+        elif self._metrics is not None:
+            self._metrics.close()
+            self._metrics = None
+
+    async def async_update_diagnostics(self, event_time):
+        diagnostics = self._diagnostics.sample()
+
+        self._data_manager.set_diagnostics(diagnostics)
+
+    async def async_check_entities_staleness(self, event_time):
+        """Safety net for changes that did not trigger an update of the entities."""
+        if not self._is_initialized or self._last_entities_update is None:
             return
 
-        if self._is_first_time_online:
-            self._is_first_time_online = False
+        if datetime.now() - self._last_entities_update < ENTITIES_MAX_STALENESS:
+            return
 
-            await self.async_update_api(datetime.now())
+        _LOGGER.debug(f'Entities were not updated since {self._last_entities_update}, forcing an update')
 
-        await self.discover_all()
+        self._entity_manager.request_full_rebuild()
+
+        self._data_manager.update(True)
+
+    async def async_flush_pending_entities(self, event_time):
+        """Write the changes held back by a deadband of records which stopped changing."""
+        if not self._is_initialized:
+            return
+
+        self._entity_manager.flush_pending_entities()
+
+        self.dispatch_updated_entities()
 
     def update(self):
+        """Called by the data manager whenever its data changed."""
         try:
+            self.device_manager.update()
+
             default_device_info = self.device_manager.get(DEFAULT_NAME)
 
             if CONF_NAME in default_device_info:
                 self.entity_manager.update()
 
+                self.dispatch_updated_entities()
+
+                if self._is_first_entity and self.entity_manager.entities_added > 0:
+                    self._is_first_entity = False
+
+                    elapsed = perf_counter() - self._init_started
+
+                    _LOGGER.info(f'First entities added {elapsed:.3f} seconds after initialization started')
+
+            self._last_entities_update = datetime.now()
             self._is_ready = True
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -193,21 +302,24 @@ class EdgeOSHomeAssistant:
 
             _LOGGER.error(f'Failed to update, Error: {ex}, Line: {line_number}')
 
-    async def discover_all(self):
-        if not self._is_ready or not self._is_initialized:
+    def dispatch_updated_entities(self):
+        if not self._is_initialized:
             return
 
-        _LOGGER.debug(f"discover_all started")
+        updated_entities = self.entity_manager.pop_updated_entities()
 
-        self.device_manager.update()
+        for domain, name in updated_entities:
+            signal = self.entity_manager.get_entity_signal(domain, name)
 
-        default_device_info = self.device_manager.get(DEFAULT_NAME)
+            async_dispatcher_send(self._hass, signal)
 
-        if CONF_NAME in default_device_info:
-            for domain in SIGNALS:
-                signal = SIGNALS.get(domain)
+    async def discover_all(self):
+        if not self._is_ready or not self._is_initialized:
+            return
 
-                async_dispatcher_send(self._hass, signal)
+        _LOGGER.debug(f"discover_all started")
+
+        self.dispatch_updated_entities()
 
     def service_save_debug_data(self, service):
         _LOGGER.debug(f'Save Debug Data: {service}')
@@ -231,6 +343,33 @@ class EdgeOSHomeAssistant:
 
         self._data_manager.log_events(enabled)
 
+    async def service_profile(self, service):
+        _LOGGER.debug(f'Profile: {service}')
+
+        name = service.data.get(CONF_NAME, self._integration_name)
+        ha = _get_ha_data(self._hass, name)
+
+        if ha is None:
+            _LOGGER.error(f'Cannot profile {name}, EdgeOS integration not found')
+
+            return
+
+        # Only one profiler can be active within the process
+        profiler_task = self._hass.data.get(DATA_EDGEOS_PROFILER)
+
+        if profiler_task is not None and not profiler_task.done():
+            _LOGGER.warning(f'Cannot profile {name}, another profile is still running')
+
+            return
+
+        profiler = EdgeOSProfiler(self._hass,
+                                  ha,
+                                  service.data.get(ATTR_MODE, PROFILE_MODE_CPROFILE),
+                                  service.data.get(ATTR_DURATION, PROFILE_DEFAULT_DURATION),
+                                  service.data.get(ATTR_TRACE_MEMORY, False))
+
+        self._hass.data[DATA_EDGEOS_PROFILER] = self._hass.async_create_task(profiler.async_run())
+
 
 def _get_ha_data(hass, name) -> EdgeOSHomeAssistant:
     ha = hass.data[DATA_EDGEOS]
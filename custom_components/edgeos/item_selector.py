@@ -0,0 +1,125 @@
+import re
+import logging
+from fnmatch import translate
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_rules(rules):
+    """List of the rules within a comma separated text, a list of rules is returned as is.
+
+    Commas within brackets, braces or parentheses (e.g. 're:eth[0-9]{1,2}') and escaped commas do not separate rules,
+    only the whitespace around a rule is removed.
+    """
+    if rules is None:
+        return []
+
+    if isinstance(rules, list):
+        return rules
+
+    result = []
+    characters = []
+    depth = 0
+    is_escaped = False
+
+    for character in rules:
+        if is_escaped:
+            is_escaped = False
+
+        elif character == RULES_ESCAPE:
+            is_escaped = True
+
+        elif character in RULES_GROUP_OPEN:
+            depth += 1
+
+        elif character in RULES_GROUP_CLOSE and depth > 0:
+            depth -= 1
+
+        elif character == RULES_SEPARATOR and depth == 0:
+            result.append(EMPTY_STRING.join(characters).strip())
+            characters = []
+
+            continue
+
+        characters.append(character)
+
+    result.append(EMPTY_STRING.join(characters).strip())
+
+    return [rule for rule in result if len(rule) > 0]
+
+
+def _compile_patterns(patterns):
+    result = None
+
+    if len(patterns) > 0:
+        result = re.compile("|".join([f"(?:{pattern})" for pattern in patterns]))
+
+    return result
+
+
+class ItemSelector:
+    """Selection of interfaces / devices by explicit keys and include / exclude rules.
+
+    Rules are glob patterns, or regular expressions when prefixed by 're:',
+    a rule has to match the whole key,
+    rules prefixed by '!' exclude the matching keys,
+    explicitly selected keys are always selected.
+    """
+
+    def __init__(self, items=None, rules=None):
+        self._items = set(items or [])
+        self._cache = {}
+
+        include_patterns = []
+        exclude_patterns = []
+
+        for rule in rules or []:
+            rule = rule.strip()
+            patterns = include_patterns
+
+            if rule.startswith(RULE_EXCLUDE_PREFIX):
+                rule = rule[len(RULE_EXCLUDE_PREFIX):]
+                patterns = exclude_patterns
+
+            if len(rule) == 0:
+                continue
+
+            if rule.startswith(RULE_REGEX_PREFIX):
+                pattern = rule[len(RULE_REGEX_PREFIX):]
+            else:
+                pattern = translate(rule)
+
+            try:
+                re.compile(pattern)
+
+                patterns.append(pattern)
+            except re.error as ex:
+                _LOGGER.warning(f"Ignoring invalid selection rule '{rule}', Error: {ex}")
+
+        self._include = _compile_patterns(include_patterns)
+        self._exclude = _compile_patterns(exclude_patterns)
+
+    @property
+    def items(self):
+        return self._items
+
+    def is_selected(self, key):
+        if key in self._items:
+            return True
+
+        is_included = self._include is not None and self._include.fullmatch(key) is not None
+        is_excluded = self._exclude is not None and self._exclude.fullmatch(key) is not None
+
+        return is_included and not is_excluded
+
+    def __contains__(self, key):
+        result = self._cache.get(key)
+
+        if result is None:
+            result = self.is_selected(key)
+
+            self._cache[key] = result
+
+        return result
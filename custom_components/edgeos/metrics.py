@@ -0,0 +1,217 @@
+import logging
+from collections import Counter
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace(NEW_LINE, '\\n')
+
+
+def _get_value(value):
+    """Sample value of a value within the router's data, None when it is not numeric."""
+    if isinstance(value, bool):
+        value = int(value)
+
+    elif value == TRUE_STR:
+        value = 1
+
+    elif value == FALSE_STR:
+        value = 0
+
+    if isinstance(value, float):
+        return repr(value)
+
+    try:
+        return str(int(value))
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        return repr(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_sample_name(family):
+    name = f'{METRICS_PREFIX}{family[ATTR_NAME]}'
+
+    if family[METRICS_TYPE] == METRICS_TYPE_COUNTER:
+        name = f'{name}{METRICS_COUNTER_SUFFIX}'
+
+    return name
+
+
+def _get_header(family):
+    name = f'{METRICS_PREFIX}{family[ATTR_NAME]}'
+
+    return f'# TYPE {name} {family[METRICS_TYPE]}\n# HELP {name} {family[METRICS_HELP]}\n'
+
+
+class EdgeOSMetrics:
+    """Renders the data of a router as OpenMetrics samples, cached between scrapes.
+
+    Samples of a record are rendered again only after the data manager marked the record as changed,
+    the samples of a family are joined again only when one of them changed.
+    """
+
+    def __init__(self, data_manager, name):
+        self._data_manager = data_manager
+        self._router_labels = f'{METRICS_LABEL_ROUTER}="{_escape(name)}"'
+
+        self._samples = {family[ATTR_NAME]: {} for family in METRICS_FAMILIES}
+        self._blocks = {}
+        self._changed_families = set()
+        self._version = 0
+        self._is_loaded = False
+
+        self._data_manager.add_changes_consumer(CHANGES_CONSUMER_METRICS)
+
+    @property
+    def version(self):
+        """Incremented whenever the blocks changed."""
+        return self._version
+
+    def close(self):
+        self._data_manager.remove_changes_consumer(CHANGES_CONSUMER_METRICS)
+
+    def get_blocks(self):
+        """Samples per family name, records changed since the previous call are rendered again."""
+        changes = self._data_manager.pop_changes(CHANGES_CONSUMER_METRICS)
+
+        if not self._is_loaded:
+            self._is_loaded = True
+
+            changes = {key: set() for key in [INTERFACES_KEY, STATIC_DEVICES_KEY, UNKNOWN_DEVICES_KEY, SYSTEM_STATS_KEY]}
+
+        if INTERFACES_KEY in changes:
+            self.render_records(METRICS_INTERFACE,
+                                METRICS_LABEL_INTERFACE,
+                                self._data_manager.get_interfaces(),
+                                changes[INTERFACES_KEY])
+
+        if STATIC_DEVICES_KEY in changes:
+            devices = self._data_manager.get_devices()
+
+            self.render_records(METRICS_DEVICE, METRICS_LABEL_DEVICE, devices, changes[STATIC_DEVICES_KEY])
+
+            self.set_sample(METRICS_DHCP_STATIC_MAPPINGS, None, self._router_labels, len(devices))
+
+        if UNKNOWN_DEVICES_KEY in changes:
+            self.render_leases()
+
+        if SYSTEM_STATS_KEY in changes:
+            self.render_record(METRICS_SYSTEM, None, self._router_labels, self._data_manager.get_system_state())
+
+        if len(self._changed_families) > 0:
+            for name in self._changed_families:
+                self._blocks[name] = EMPTY_STRING.join(self._samples[name].values())
+
+            self._changed_families.clear()
+            self._version += 1
+
+        return self._blocks
+
+    def render_records(self, metrics, label, records, changed_keys):
+        """Render the changed records, all of them when the change was not tracked per record."""
+        if len(changed_keys) == 0:
+            record_keys = set(records.keys())
+
+            for family in metrics.values():
+                record_keys.update(self._samples[family[ATTR_NAME]].keys())
+        else:
+            record_keys = changed_keys
+
+        for record_key in record_keys:
+            labels = f'{self._router_labels},{label}="{_escape(record_key)}"'
+
+            self.render_record(metrics, record_key, labels, records.get(record_key))
+
+    def render_record(self, metrics, record_key, labels, record):
+        for key in metrics:
+            value = None
+
+            if record is not None:
+                value = record.get(key)
+
+            self.set_sample(metrics[key], record_key, labels, value)
+
+    def render_leases(self):
+        leases = Counter([lease.get(LEASE_POOL) for lease in self._data_manager.get_unknown_devices()])
+        samples = self._samples[METRICS_DHCP_LEASES[ATTR_NAME]]
+
+        for pool in set(samples.keys()) | set(leases.keys()):
+            labels = f'{self._router_labels},{METRICS_LABEL_POOL}="{_escape(pool)}"'
+
+            self.set_sample(METRICS_DHCP_LEASES, pool, labels, leases.get(pool))
+
+    def set_sample(self, family, record_key, labels, value):
+        name = family[ATTR_NAME]
+        samples = self._samples[name]
+        sample_value = _get_value(value)
+
+        if sample_value is None:
+            if record_key in samples:
+                del samples[record_key]
+
+                self._changed_families.add(name)
+
+            return
+
+        sample = f'{_get_sample_name(family)}{{{labels}}} {sample_value}\n'
+
+        if samples.get(record_key) != sample:
+            samples[record_key] = sample
+
+            self._changed_families.add(name)
+
+
+class EdgeOSMetricsView(HomeAssistantView):
+    """OpenMetrics endpoint of all routers with the endpoint enabled, the text is kept until a router changed."""
+
+    url = METRICS_URL
+    name = METRICS_VIEW_NAME
+    requires_auth = True
+
+    def __init__(self):
+        self._body = None
+        self._versions = None
+
+    async def get(self, request):
+        hass = request.app['hass']
+        edgeos_data = hass.data.get(DATA_EDGEOS, {})
+
+        all_metrics = [edgeos_data[name].metrics for name in edgeos_data if edgeos_data[name].metrics is not None]
+        all_blocks = [metrics.get_blocks() for metrics in all_metrics]
+
+        versions = [(id(metrics), metrics.version) for metrics in all_metrics]
+
+        if self._body is None or versions != self._versions:
+            self._body = self.render(all_blocks).encode()
+            self._versions = versions
+
+        return web.Response(body=self._body, headers={'Content-Type': METRICS_CONTENT_TYPE})
+
+    @staticmethod
+    def render(all_blocks):
+        lines = []
+
+        for family in METRICS_FAMILIES:
+            name = family[ATTR_NAME]
+            family_blocks = [blocks.get(name, EMPTY_STRING) for blocks in all_blocks]
+
+            if not any(family_blocks):
+                continue
+
+            lines.append(_get_header(family))
+            lines.extend(family_blocks)
+
+        lines.append(METRICS_EOF)
+
+        return EMPTY_STRING.join(lines)
@@ -0,0 +1,215 @@
+import io
+import sys
+import logging
+import asyncio
+import cProfile
+import pstats
+import threading
+import tracemalloc
+from collections import Counter
+from time import perf_counter
+
+from homeassistant.util import slugify
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_frame_description(frame):
+    code = frame.f_code
+
+    return f'{code.co_filename}:{code.co_firstlineno}({code.co_name})'
+
+
+class EdgeOSProfiler:
+    """Profiles the event loop for a fixed duration and writes a report to the config directory.
+
+    The profilers see everything running on the event loop, the counters of the
+    selected router are reported next to them to relate the load to that router.
+    """
+
+    def __init__(self, hass, ha, mode, duration, trace_memory):
+        self._hass = hass
+        self._ha = ha
+        self._mode = mode
+        self._duration = duration
+        self._trace_memory = trace_memory
+
+        self._profile = None
+        self._samples = Counter()
+        self._sampler = None
+        self._stop_sampling = threading.Event()
+        self._is_tracing_memory = False
+
+    def get_counters(self):
+        data_manager = self._ha.data_manager
+        entity_manager = self._ha.entity_manager
+        web_socket = data_manager.web_socket
+        api = data_manager.api
+
+        counters = {
+            'WS messages': web_socket.messages_received,
+            'WS decode time (s)': web_socket.decode_time,
+            'API requests': api.requests,
+            'API request time (s)': api.request_time,
+            'Entities rebuilt': entity_manager.rebuild_count,
+            'State writes': entity_manager.state_writes,
+            'Suppressed writes': entity_manager.suppressed_writes,
+            'Reconnects': data_manager.reconnect_count
+        }
+
+        return counters
+
+    async def async_run(self):
+        name = self._ha.integration_name
+        path = self._hass.config.path(PROFILE_REPORT_TEMPLATE.format(slugify(name),
+                                                                     datetime.now().strftime('%Y%m%d%H%M%S')))
+
+        _LOGGER.info(f'Profiling {name} using {self._mode} for {self._duration} seconds')
+
+        counters_before = self.get_counters()
+        started = perf_counter()
+
+        self.start()
+
+        try:
+            try:
+                await asyncio.sleep(self._duration)
+            finally:
+                report = self.stop()
+
+            if self._trace_memory and tracemalloc.is_tracing():
+                # The snapshot walks every traced allocation, it is taken off the event loop
+                memory_report = await self._hass.async_add_executor_job(self.get_memory_report)
+
+                report.extend(memory_report)
+        finally:
+            self.stop_memory_tracing()
+
+        elapsed = perf_counter() - started
+        counters_after = self.get_counters()
+
+        lines = [
+            f'EdgeOS profile of {name}, Mode: {self._mode}, Duration: {elapsed:.1f} seconds',
+            EMPTY_STRING,
+            'Router counters during the profile:'
+        ]
+
+        for key in counters_after:
+            lines.append(f'    {key}: {counters_after[key] - counters_before[key]:g}')
+
+        lines.append(EMPTY_STRING)
+        lines.extend(report)
+
+        await self._hass.async_add_executor_job(self.save, path, NEW_LINE.join(lines))
+
+        _LOGGER.info(f'Profile of {name} saved to {path}')
+
+    def start(self):
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+
+            self._is_tracing_memory = True
+
+        if self._mode == PROFILE_MODE_SAMPLING:
+            self._sampler = threading.Thread(target=self.sample,
+                                             args=(threading.get_ident(), ),
+                                             name=f'{DOMAIN}_profiler',
+                                             daemon=True)
+            self._sampler.start()
+        else:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self):
+        report = []
+
+        if self._profile is not None:
+            self._profile.disable()
+
+            report.extend(self.get_profile_report())
+
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+
+            report.extend(self.get_sampling_report())
+
+        return report
+
+    def stop_memory_tracing(self):
+        if self._is_tracing_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        self._is_tracing_memory = False
+
+    def sample(self, thread_id):
+        """Collect the stacks of the event loop thread until stopped."""
+        while not self._stop_sampling.wait(PROFILE_SAMPLING_INTERVAL):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+
+            while frame is not None:
+                stack.append(_get_frame_description(frame))
+
+                frame = frame.f_back
+
+            if len(stack) > 0:
+                self._samples[tuple(reversed(stack))] += 1
+
+    def get_profile_report(self):
+        output = io.StringIO()
+
+        stats = pstats.Stats(self._profile, stream=output)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_REPORT_ITEMS)
+
+        return ['cProfile (sorted by cumulative time):', output.getvalue()]
+
+    def get_sampling_report(self):
+        total_samples = sum(self._samples.values())
+        own_samples = Counter()
+
+        for stack in self._samples:
+            own_samples[stack[-1]] += self._samples[stack]
+
+        report = [f'Sampling every {PROFILE_SAMPLING_INTERVAL * 1000:g}ms, {total_samples} samples', 'Top frames:']
+
+        for frame_description, count in own_samples.most_common(PROFILE_REPORT_ITEMS):
+            report.append(f'    {count / total_samples:7.2%} {frame_description}')
+
+        report.append(EMPTY_STRING)
+        report.append('Collapsed stacks (flame graph input):')
+
+        for stack, count in self._samples.most_common():
+            report.append(f'{";".join(stack)} {count}')
+
+        report.append(EMPTY_STRING)
+
+        return report
+
+    @staticmethod
+    def get_memory_report():
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+
+        report = [f'tracemalloc, Current: {current / 1024:.1f} KiB, Peak: {peak / 1024:.1f} KiB', 'Top allocations:']
+
+        for statistic in snapshot.statistics('lineno')[:PROFILE_REPORT_ITEMS]:
+            report.append(f'    {statistic}')
+
+        report.append(EMPTY_STRING)
+
+        return report
+
+    @staticmethod
+    def save(path, content):
+        try:
+            with open(path, 'w+') as out:
+                out.write(content)
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f'Failed to save profile to {path}, Error: {ex}, Line: {line_number}')
@@ -0,0 +1,166 @@
+import sys
+import math
+import logging
+import asyncio
+
+from homeassistant.core import callback
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_scheduler(hass):
+    """Integration wide scheduler, shared by all the routers."""
+    scheduler = hass.data.get(DATA_EDGEOS_SCHEDULER)
+
+    if scheduler is None:
+        scheduler = EdgeOSScheduler(hass)
+
+        hass.data[DATA_EDGEOS_SCHEDULER] = scheduler
+
+    return scheduler
+
+
+class ScheduledJob:
+    def __init__(self, key, interval, action, is_poll):
+        self.key = key
+        self.interval = interval
+        self.action = action
+        self.is_poll = is_poll
+        self.due = None
+        self.lag = None
+        self.skipped = 0
+        self.task = None
+
+
+class EdgeOSScheduler:
+    """Periodic work of all the routers, spread across the interval.
+
+    Jobs sharing an interval are phase shifted evenly across it,
+    concurrent REST polls and logins are capped by semaphores.
+    """
+
+    def __init__(self, hass):
+        self._hass = hass
+        self._loop = hass.loop
+        self._epoch = self._loop.time()
+        self._jobs = {}
+        self._timer = None
+
+        self._login_semaphore = asyncio.Semaphore(SCHEDULER_MAX_CONCURRENT_LOGINS)
+        self._poll_semaphore = asyncio.Semaphore(SCHEDULER_MAX_CONCURRENT_POLLS)
+
+    @property
+    def login_semaphore(self):
+        return self._login_semaphore
+
+    @property
+    def poll_semaphore(self):
+        return self._poll_semaphore
+
+    def register(self, key, interval, action, is_poll=False):
+        """Run the coroutine function action(event_time) every interval."""
+        job = ScheduledJob(key, interval.total_seconds(), action, is_poll)
+
+        self.unregister(key)
+
+        self._jobs[key] = job
+
+        self._rebalance(job.interval)
+        self._schedule()
+
+    def unregister(self, key):
+        job = self._jobs.pop(key, None)
+
+        if job is not None:
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
+
+            self._rebalance(job.interval)
+            self._schedule()
+
+    def get_lag(self, key):
+        """Seconds between the due time of the last run and its actual start."""
+        job = self._jobs.get(key)
+        lag = None
+
+        if job is not None:
+            lag = job.lag
+
+        return lag
+
+    def _rebalance(self, interval):
+        jobs = [job for job in self._jobs.values() if job.interval == interval]
+        jobs.sort(key=lambda item: item.key)
+
+        now = self._loop.time()
+        jobs_count = len(jobs)
+
+        for index, job in enumerate(jobs):
+            phase = self._epoch + (index * interval / jobs_count)
+            cycles = math.floor((now - phase) / interval) + 1
+
+            job.due = phase + (cycles * interval)
+
+    def _schedule(self):
+        if self._timer is not None:
+            self._timer.cancel()
+
+            self._timer = None
+
+        if len(self._jobs) > 0:
+            next_due = min([job.due for job in self._jobs.values()])
+
+            self._timer = self._loop.call_at(next_due, self._run_due_jobs)
+
+    @callback
+    def _run_due_jobs(self):
+        self._timer = None
+
+        now = self._loop.time()
+
+        for job in self._jobs.values():
+            if job.due > now:
+                continue
+
+            scheduled = job.due
+
+            # Missed cycles are skipped instead of running back to back
+            job.due += job.interval * (math.floor((now - job.due) / job.interval) + 1)
+
+            if job.task is not None and not job.task.done():
+                job.skipped += 1
+
+                _LOGGER.debug(f'Previous run of {job.key} is still in progress, skipped {job.skipped} runs')
+
+                continue
+
+            job.task = self._hass.async_create_task(self._run(job, scheduled))
+
+        self._schedule()
+
+    async def _run(self, job, scheduled):
+        try:
+            if job.is_poll:
+                async with self._poll_semaphore:
+                    await self._execute(job, scheduled)
+            else:
+                await self._execute(job, scheduled)
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.error(f'Failed to run {job.key}, Error: {ex}, Line: {line_number}')
+
+    async def _execute(self, job, scheduled):
+        job.lag = self._loop.time() - scheduled
+
+        if job.lag > SCHEDULER_LAG_WARNING:
+            _LOGGER.warning(f'{job.key} started {job.lag:.1f} seconds late')
+
+        await job.action(datetime.now())
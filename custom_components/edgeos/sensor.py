@@ -4,7 +4,7 @@ For more details about this platform, please refer to the documentation at
 https://home-assistant.io/components/binary_sensor.edgeos/
 """
 import logging
-from typing import Union
+from typing import Optional, Union
 
 from .base_entity import EdgeOSEntity, _async_setup_entry
 from .const import *
@@ -36,3 +36,26 @@ class EdgeOSSensor(EdgeOSEntity):
     def state(self) -> Union[None, str, int, float]:
         """Return the state of the sensor."""
         return self._entity.get(ENTITY_STATE)
+
+    @property
+    def unit_of_measurement(self) -> Optional[str]:
+        """Return the unit of measurement of the sensor."""
+        return self._entity.get(ENTITY_UNIT)
+
+    @property
+    def state_class(self) -> Optional[str]:
+        """Return the state class of the sensor, used by long-term statistics."""
+        return self._entity.get(ENTITY_STATE_CLASS)
+
+    @property
+    def capability_attributes(self):
+        """Return the capability attributes of the sensor."""
+        attributes = None
+        state_class = self.state_class
+
+        if state_class is not None:
+            attributes = {
+                ATTR_STATE_CLASS: state_class
+            }
+
+        return attributes
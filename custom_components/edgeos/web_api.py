@@ -7,6 +7,7 @@ import sys
 import logging
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 import aiohttp
+from time import perf_counter
 from .const import *
 
 REQUIREMENTS = ['aiohttp']
@@ -23,17 +24,28 @@ class EdgeOSWebAPI:
         self._edgeos_url = edgeos_url
         self._hass = hass
         self._is_connected = False
+        self._session_generation = 0
+        self._requests = 0
+        self._request_time = 0
 
         self._disconnection_handler = disconnection_handler
 
-    async def initialize(self, cookies):
-        if self._hass is None:
-            if self._session is not None:
-                await self._session.close()
+    async def initialize(self, cookie_jar):
+        # Reconnections replace the session, the previous one would remain open until Home Assistant stops
+        await self.close()
 
-            self._session = aiohttp.client.ClientSession(cookies=cookies)
+        if self._hass is None:
+            self._session = aiohttp.client.ClientSession(cookie_jar=cookie_jar)
         else:
-            self._session = async_create_clientsession(hass=self._hass, cookies=cookies)
+            self._session = async_create_clientsession(hass=self._hass, cookie_jar=cookie_jar)
+
+        self._session_generation += 1
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
 
     @property
     def is_initialized(self):
@@ -43,8 +55,20 @@ class EdgeOSWebAPI:
     def is_connected(self):
         return self._is_connected
 
-    async def async_get(self, url):
+    @property
+    def requests(self):
+        return self._requests
+
+    @property
+    def request_time(self):
+        """Total seconds spent waiting for responses."""
+        return self._request_time
+
+    async def async_get(self, url, retry=True):
         result = None
+        is_forbidden = False
+        session_generation = self._session_generation
+        started = perf_counter()
 
         try:
             async with self._session.get(url, ssl=False) as response:
@@ -53,7 +77,7 @@ class EdgeOSWebAPI:
                 self._is_connected = response.status < 400
 
                 if response.status == 403:
-                    await self._disconnection_handler()
+                    is_forbidden = True
 
                 else:
                     response.raise_for_status()
@@ -70,6 +94,19 @@ class EdgeOSWebAPI:
 
             _LOGGER.error(f'Failed to connect {url}, Error: {ex}, Line: {line_number}')
 
+        self._requests += 1
+        self._request_time += perf_counter() - started
+
+        if is_forbidden and retry:
+            # Session might have been replaced while the request was in flight
+            is_reconnected = session_generation != self._session_generation
+
+            if not is_reconnected:
+                is_reconnected = await self._disconnection_handler()
+
+            if is_reconnected:
+                result = await self.async_get(url, False)
+
         return result
 
     @property
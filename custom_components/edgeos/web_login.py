@@ -1,19 +1,26 @@
 import sys
 import logging
-import requests
-from time import sleep
-import urllib3
+import asyncio
+import aiohttp
+from yarl import URL
 from homeassistant.exceptions import HomeAssistantError
-from requests import HTTPError
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
 
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class EdgeOSWebLogin(requests.Session):
-    def __init__(self, host, username, password):
-        requests.Session.__init__(self)
+class EdgeOSWebLogin:
+    def __init__(self, hass, host, username, password, name=None):
+        self._hass = hass
+        self._session = None
+        self._cookie_jar = None
+        self._store = None
+
+        self.set_name(name)
 
         self._credentials = {
             CONF_USERNAME: username,
@@ -22,36 +29,155 @@ class EdgeOSWebLogin(requests.Session):
 
         self._edgeos_url = API_URL_TEMPLATE.format(host)
 
-        ''' This function turns off InsecureRequestWarnings '''
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        heartbeat_req_url = EDGEOS_API_URL.format(self._edgeos_url, EDGEOS_API_HEARTBREAT)
+        self._heartbeat_url_template = API_URL_HEARTBEAT_TEMPLATE.format(heartbeat_req_url, '{}')
 
     @property
     def session_id(self):
         session_id = None
 
-        if self.cookies is not None and COOKIE_PHPSESSID in self.cookies:
-            session_id = self.cookies[COOKIE_PHPSESSID]
+        if self._cookie_jar is not None:
+            for cookie in self._cookie_jar:
+                if cookie.key == COOKIE_PHPSESSID:
+                    session_id = cookie.value
 
         return session_id
 
     @property
-    def cookies_data(self):
-        return self.cookies
+    def cookie_jar(self):
+        return self._cookie_jar
+
+    def set_name(self, name):
+        """Sessions are persisted under the name of the entry, not persisted without a name."""
+        self._store = None
+
+        if self._hass is not None and name is not None:
+            self._store = Store(self._hass, STORAGE_VERSION, STORAGE_KEY_SESSION.format(slugify(name)))
+
+    def _create_session(self):
+        # unsafe=True allows the jar to keep cookies of routers addressed by IP
+        self._cookie_jar = aiohttp.CookieJar(unsafe=True)
+
+        if self._hass is None:
+            self._session = aiohttp.client.ClientSession(cookie_jar=self._cookie_jar)
+        else:
+            self._session = async_create_clientsession(hass=self._hass, cookie_jar=self._cookie_jar)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+
+    async def is_session_valid(self):
+        ts = str(int(datetime.now().timestamp()))
+        heartbeat_url = self._heartbeat_url_template.format(ts)
+
+        async with self._session.get(heartbeat_url, ssl=False) as response:
+            _LOGGER.debug(f'Status of session validation: {response.status}')
+
+            if response.status >= 400:
+                return False
+
+            # The router answers the heartbeat of an expired session as well, reporting it as not active
+            heartbeat = await response.json(content_type=None)
+
+            return heartbeat is not None and heartbeat.get(HEARTBEAT_SESSION) in [True, TRUE_STR]
+
+    async def wait_for_session(self):
+        """Poll until the router completed storing the new session."""
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + LOGIN_SESSION_READY_TIMEOUT
+
+        while True:
+            is_valid = await self.is_session_valid()
+
+            if is_valid or loop.time() >= deadline:
+                return is_valid
+
+            await asyncio.sleep(LOGIN_SESSION_READY_INTERVAL)
+
+    async def save_session(self):
+        session_id = self.session_id
+
+        if self._store is not None and session_id is not None:
+            data = {
+                COOKIE_PHPSESSID: session_id,
+                STORAGE_LAST_VALIDATED: datetime.now().isoformat()
+            }
+
+            await self._store.async_save(data)
+
+    async def use_session(self, session_id):
+        """Continue an existing session, returns whether the router still accepts it."""
+        await self.close()
+
+        self._create_session()
+
+        cookies = {
+            COOKIE_PHPSESSID: session_id
+        }
 
-    def login(self, throw_exception=False):
+        self._cookie_jar.update_cookies(cookies, URL(self._edgeos_url))
+
+        return await self.is_session_valid()
+
+    async def restore_session(self):
+        """Reuse the persisted session when the router still accepts it."""
+        if self._store is None:
+            return False
+
+        try:
+            stored_session = await self._store.async_load()
+
+            if stored_session is None or stored_session.get(COOKIE_PHPSESSID) is None:
+                return False
+
+            last_validated = stored_session.get(STORAGE_LAST_VALIDATED)
+
+            if await self.use_session(stored_session.get(COOKIE_PHPSESSID)):
+                _LOGGER.debug(f'Reusing stored session, last validated at {last_validated}')
+
+                await self.save_session()
+
+                return True
+
+            _LOGGER.debug(f'Stored session (last validated at {last_validated}) expired')
+
+        except Exception as ex:
+            exc_type, exc_obj, tb = sys.exc_info()
+            line_number = tb.tb_lineno
+
+            _LOGGER.warning(f'Failed to restore stored session, Error: {ex}, Line: {line_number}')
+
+        return False
+
+    async def login(self, throw_exception=False):
         status_code = None
         try:
-            login_response = self.post(self._edgeos_url, data=self._credentials, verify=False)
+            await self.close()
+
+            self._create_session()
+
+            async with self._session.post(self._edgeos_url, data=self._credentials, ssl=False) as login_response:
+                status_code = login_response.status
+
+                login_response.raise_for_status()
+
+            if not await self.wait_for_session():
+                _LOGGER.error(f"Failed to login, Session was not ready after {LOGIN_SESSION_READY_TIMEOUT} seconds")
 
-            status_code = login_response.status_code
+                if throw_exception:
+                    raise LoginException(status_code)
 
-            login_response.raise_for_status()
+                return False
 
-            _LOGGER.debug("Sleeping 2 to make sure the session id is in the filesystem")
-            sleep(2)
+            await self.save_session()
 
             return True
-        except HTTPError as ex_http:
+        except LoginException:
+            raise
+        except aiohttp.ClientResponseError as ex_http:
             exc_type, exc_obj, tb = sys.exc_info()
             line_number = tb.tb_lineno
 
@@ -6,6 +6,7 @@ https://home-assistant.io/components/edgeos/
 import re
 import logging
 import json
+from time import perf_counter
 from urllib.parse import urlparse
 import aiohttp
 import asyncio
@@ -32,12 +33,14 @@ class EdgeOSWebSocket:
         self._ws = None
         self._pending_payloads = []
         self._shutting_down = False
+        self._messages_received = 0
+        self._decode_time = 0
 
         url = urlparse(self._edgeos_url)
 
         self._ws_url = WEBSOCKET_URL_TEMPLATE.format(url.netloc)
 
-    async def initialize(self, cookies, session_id):
+    async def initialize(self, cookie_jar, session_id):
         _LOGGER.debug("Initializing WS connection")
 
         try:
@@ -45,9 +48,9 @@ class EdgeOSWebSocket:
 
             self._session_id = session_id
             if self._hass is None:
-                self._session = aiohttp.client.ClientSession(cookies=cookies)
+                self._session = aiohttp.client.ClientSession(cookie_jar=cookie_jar)
             else:
-                self._session = async_create_clientsession(hass=self._hass, cookies=cookies)
+                self._session = async_create_clientsession(hass=self._hass, cookie_jar=cookie_jar)
 
         except Exception as ex:
             _LOGGER.warning(f"Failed to create session of EdgeOS WS, Error: {str(ex)}")
@@ -96,6 +99,15 @@ class EdgeOSWebSocket:
 
         return result
 
+    @property
+    def messages_received(self):
+        return self._messages_received
+
+    @property
+    def decode_time(self):
+        """Total seconds spent decoding messages."""
+        return self._decode_time
+
     def parse_message(self, message):
         parsed = False
 
@@ -108,7 +120,12 @@ class EdgeOSWebSocket:
                 message = f'{message_previous}{message}'
 
             if len(message) > 0:
-                payload_json = json.loads(message)
+                started = perf_counter()
+
+                try:
+                    payload_json = json.loads(message)
+                finally:
+                    self._decode_time += perf_counter() - started
 
                 self._edgeos_callback(payload_json)
                 parsed = True
@@ -157,6 +174,7 @@ class EdgeOSWebSocket:
                 _LOGGER.debug(f'New message received: {str(msg)}')
 
             self._last_update = datetime.now()
+            self._messages_received += 1
 
             if msg.data == 'close':
                 result = False
@@ -178,6 +196,9 @@ class EdgeOSWebSocket:
 
         self._ws = None
 
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
     def get_subscription_data(self):
         topics_to_subscribe = [{WS_TOPIC_NAME: topic} for topic in self._topics]
         topics_to_unsubscribe = []
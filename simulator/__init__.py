@@ -0,0 +1,3 @@
+"""
+Local EdgeOS router simulator, see __main__.py for the command line.
+"""
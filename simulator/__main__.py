@@ -0,0 +1,267 @@
+"""
+Local EdgeOS router simulator, serves the endpoints used by the integration over HTTPS.
+
+Self signed certificate for local use:
+    openssl req -x509 -newkey rsa:2048 -nodes -days 365 -subj "/CN=localhost" -keyout key.pem -out cert.pem
+
+Run:
+    python -m simulator --cert cert.pem --key key.pem --port 8443 --clients 1000 --export-interval 1
+"""
+import argparse
+import asyncio
+import json
+import logging
+import ssl
+import time
+import uuid
+
+from aiohttp import web, WSMsgType
+
+from .data import EdgeOSSimulatorData
+
+_LOGGER = logging.getLogger(__name__)
+
+COOKIE_PHPSESSID = 'PHPSESSID'
+
+TOPIC_EXPORT = 'export'
+TOPIC_INTERFACES = 'interfaces'
+TOPIC_SYSTEM_STATS = 'system-stats'
+TOPIC_DISCOVER = 'discover'
+
+
+class EdgeOSSimulator:
+    def __init__(self, data: EdgeOSSimulatorData, username, password, intervals, session_lifetime=None,
+                 chunk_size=0):
+        self._data = data
+        self._username = username
+        self._password = password
+        self._intervals = intervals
+        self._session_lifetime = session_lifetime
+        self._chunk_size = chunk_size
+
+        self._sessions = {}
+        self._messages_sent = 0
+        self._bytes_sent = 0
+        self._requests = 0
+
+        self._topic_payloads = {
+            TOPIC_EXPORT: self._data.get_export,
+            TOPIC_INTERFACES: self._data.get_interfaces,
+            TOPIC_SYSTEM_STATS: self._data.get_system_stats,
+            TOPIC_DISCOVER: self._data.get_discover
+        }
+
+    def create_app(self):
+        app = web.Application()
+
+        app.router.add_post('/', self.login)
+        app.router.add_get('/api/edge/get.json', self.get)
+        app.router.add_get('/api/edge/data.json', self.data)
+        app.router.add_get('/api/edge/heartbeat.json', self.heartbeat)
+        app.router.add_get('/ws/stats', self.web_socket)
+
+        return app
+
+    def is_session_valid(self, session_id):
+        created = self._sessions.get(session_id)
+        is_valid = created is not None
+
+        if is_valid and self._session_lifetime is not None and time.time() - created > self._session_lifetime:
+            del self._sessions[session_id]
+
+            is_valid = False
+
+        return is_valid
+
+    def is_authorized(self, request):
+        self._requests += 1
+
+        return self.is_session_valid(request.cookies.get(COOKIE_PHPSESSID))
+
+    async def login(self, request):
+        form = await request.post()
+
+        if form.get('username') != self._username or form.get('password') != self._password:
+            raise web.HTTPForbidden()
+
+        session_id = uuid.uuid4().hex
+        self._sessions[session_id] = time.time()
+
+        response = web.Response(text='OK')
+        response.set_cookie(COOKIE_PHPSESSID, session_id, secure=True, httponly=True)
+
+        return response
+
+    async def get(self, request):
+        if not self.is_authorized(request):
+            raise web.HTTPForbidden()
+
+        return web.json_response({'success': True, 'GET': self._data.get_config()})
+
+    async def data(self, request):
+        if not self.is_authorized(request):
+            raise web.HTTPForbidden()
+
+        item = request.query.get('data')
+
+        if item == 'dhcp_leases':
+            result = {'success': '1', 'output': self._data.get_dhcp_leases()}
+        else:
+            result = {'success': '0', 'error': f'{item} is not simulated'}
+
+        return web.json_response(result)
+
+    async def heartbeat(self, request):
+        is_authorized = self.is_authorized(request)
+
+        # Like the router, an unknown or expired session is answered with an inactive session
+        return web.json_response({'SESSION': is_authorized, 'PING': True})
+
+    async def web_socket(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        senders = []
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    break
+
+                content = msg.data.split('\n', 1)[-1]
+                subscription = json.loads(content)
+
+                if not self.is_session_valid(subscription.get('SESSION_ID')):
+                    _LOGGER.info('WS subscription with invalid session, closing')
+
+                    break
+
+                for topic in subscription.get('SUBSCRIBE', []):
+                    topic_name = topic.get('name')
+
+                    if topic_name in self._topic_payloads:
+                        senders.append(asyncio.ensure_future(self.send_topic(ws, topic_name)))
+
+        finally:
+            for sender in senders:
+                sender.cancel()
+
+            await ws.close()
+
+        return ws
+
+    async def send_topic(self, ws, topic_name):
+        get_payload = self._topic_payloads[topic_name]
+        interval = self._intervals[topic_name]
+
+        while not ws.closed:
+            content = json.dumps({topic_name: get_payload()}, separators=(',', ':'))
+            frame = f'{len(content)}\n{content}'
+
+            if self._chunk_size > 0:
+                chunks = [frame[index:index + self._chunk_size] for index in range(0, len(frame), self._chunk_size)]
+            else:
+                chunks = [frame]
+
+            for chunk in chunks:
+                await ws.send_str(chunk)
+
+            self._messages_sent += 1
+            self._bytes_sent += len(frame)
+
+            await asyncio.sleep(interval)
+
+    async def report(self, interval):
+        previous_messages = 0
+        previous_bytes = 0
+
+        while True:
+            await asyncio.sleep(interval)
+
+            messages = self._messages_sent - previous_messages
+            sent_bytes = self._bytes_sent - previous_bytes
+
+            previous_messages = self._messages_sent
+            previous_bytes = self._bytes_sent
+
+            _LOGGER.info(f'WS: {messages / interval:.1f} msg/s, {sent_bytes / interval / 1024:.1f} KiB/s, '
+                         f'REST requests: {self._requests}, Sessions: {len(self._sessions)}')
+
+
+def get_arguments():
+    parser = argparse.ArgumentParser(description='Local EdgeOS router simulator')
+
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8443)
+    parser.add_argument('--cert', required=True, help='TLS certificate (PEM)')
+    parser.add_argument('--key', required=True, help='TLS private key (PEM)')
+    parser.add_argument('--username', default='ubnt')
+    parser.add_argument('--password', default='ubnt')
+
+    parser.add_argument('--clients', type=int, default=50, help='Static mappings (DHCP clients)')
+    parser.add_argument('--unknown-clients', type=int, default=10, help='DHCP leases without static mapping')
+    parser.add_argument('--interfaces', type=int, default=5)
+    parser.add_argument('--vifs', type=int, default=2, help='VLANs per interface')
+    parser.add_argument('--dpi-categories', type=int, default=4, help='DPI categories per client')
+    parser.add_argument('--neighbours', type=int, default=1, help='Discovered devices, the first is the router')
+    parser.add_argument('--active-ratio', type=float, default=0.5, help='Ratio of clients in each export')
+
+    parser.add_argument('--export-interval', type=float, default=1)
+    parser.add_argument('--interfaces-interval', type=float, default=1)
+    parser.add_argument('--system-stats-interval', type=float, default=3)
+    parser.add_argument('--discover-interval', type=float, default=10)
+
+    parser.add_argument('--session-lifetime', type=float, default=None,
+                        help='Seconds until sessions expire, to exercise reconnection')
+    parser.add_argument('--chunk-size', type=int, default=0,
+                        help='Split WS frames to messages of this size, to exercise reassembly')
+    parser.add_argument('--report-interval', type=float, default=10)
+    parser.add_argument('--seed', type=int, default=None)
+
+    return parser.parse_args()
+
+
+def main():
+    args = get_arguments()
+
+    logging.basicConfig(level=logging.INFO)
+
+    data = EdgeOSSimulatorData(clients=args.clients,
+                               interfaces=args.interfaces,
+                               vifs=args.vifs,
+                               dpi_categories=args.dpi_categories,
+                               neighbours=args.neighbours,
+                               unknown_clients=args.unknown_clients,
+                               active_ratio=args.active_ratio,
+                               host=args.host,
+                               seed=args.seed)
+
+    intervals = {
+        TOPIC_EXPORT: args.export_interval,
+        TOPIC_INTERFACES: args.interfaces_interval,
+        TOPIC_SYSTEM_STATS: args.system_stats_interval,
+        TOPIC_DISCOVER: args.discover_interval
+    }
+
+    simulator = EdgeOSSimulator(data, args.username, args.password, intervals, args.session_lifetime,
+                                args.chunk_size)
+
+    ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    ssl_context.load_cert_chain(args.cert, args.key)
+
+    app = simulator.create_app()
+
+    async def start_report(application):
+        application['report'] = asyncio.ensure_future(simulator.report(args.report_interval))
+
+    async def stop_report(application):
+        application['report'].cancel()
+
+    app.on_startup.append(start_report)
+    app.on_cleanup.append(stop_report)
+
+    web.run_app(app, host=args.host, port=args.port, ssl_context=ssl_context)
+
+
+if __name__ == '__main__':
+    main()
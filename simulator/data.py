@@ -0,0 +1,246 @@
+"""
+Synthetic EdgeOS payloads, shaped like the responses and WS messages of a real router.
+"""
+import random
+import time
+
+DPI_CATEGORIES = ['Web', 'Video', 'Streaming Media', 'Network Protocols', 'File Transfer', 'Social Network',
+                  'Instant Messaging', 'Games', 'Mail and Collaboration', 'VPN and Proxy Tools', 'Web Services',
+                  'Private Protocol', 'Database', 'Remote Access Terminals', 'Business Tools', 'Network Services']
+
+INTERFACE_STATS = ['rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes', 'rx_errors', 'tx_errors',
+                   'rx_dropped', 'tx_dropped', 'multicast']
+
+PRODUCT = 'ER-X'
+FIRMWARE_VERSION = 'v2.0.9-hotfix.1'
+LAN_NETWORK = 'LAN'
+
+
+def _get_mac(prefix, index):
+    return f'{prefix}:{(index >> 16) & 0xff:02x}:{(index >> 8) & 0xff:02x}:{index & 0xff:02x}'
+
+
+def _get_ip(index, network=10):
+    return f'10.{network}.{(index >> 8) & 0xff}.{index & 0xff}'
+
+
+class EdgeOSSimulatorData:
+    """State of a simulated router, traffic counters advance on every generated message.
+
+    Clients 0..N are static mappings, unknown clients only have DHCP leases,
+    each interface gets the configured amount of VLANs (vif).
+    """
+
+    def __init__(self, clients=50, interfaces=5, vifs=2, dpi_categories=4, neighbours=1, unknown_clients=10,
+                 active_ratio=0.5, host='127.0.0.1', seed=None):
+        self._random = random.Random(seed)
+        self._started = time.time()
+
+        self._host = host
+        self._active_ratio = active_ratio
+
+        self._clients = [(f'client-{index}', _get_ip(index), _get_mac('00:aa:bb', index))
+                         for index in range(clients)]
+
+        self._unknown_clients = [(f'unknown-{index}', _get_ip(index, 20), _get_mac('00:cc:dd', index))
+                                 for index in range(unknown_clients)]
+
+        self._interfaces = [f'eth{index}' for index in range(interfaces)]
+        self._vifs = [vif for vif in range(10, 10 + vifs)]
+        self._dpi_categories = [DPI_CATEGORIES[index] if index < len(DPI_CATEGORIES) else f'Category {index}'
+                                for index in range(dpi_categories)]
+
+        self._neighbours = neighbours
+
+        self._client_counters = {}
+        self._interface_counters = {}
+
+    @property
+    def clients(self):
+        return self._clients
+
+    @property
+    def interface_names(self):
+        names = []
+
+        for interface in self._interfaces:
+            names.append(interface)
+
+            for vif in self._vifs:
+                names.append(f'{interface}.{vif}')
+
+        return names
+
+    def get_config(self):
+        """Content of GET in /api/edge/get.json."""
+        static_mappings = {}
+
+        for hostname, ip, mac in self._clients:
+            static_mappings[hostname] = {
+                'ip-address': ip,
+                'mac-address': mac
+            }
+
+        interfaces = {}
+
+        for interface in self._interfaces:
+            interfaces[interface] = {
+                'description': f'{interface} uplink' if interface == 'eth0' else f'{interface} port',
+                'vif': {str(vif): {'description': f'VLAN {vif}'} for vif in self._vifs}
+            }
+
+        config = {
+            'interfaces': {
+                'ethernet': interfaces,
+                'loopback': {
+                    'lo': {}
+                }
+            },
+            'service': {
+                'dhcp-server': {
+                    'shared-network-name': {
+                        LAN_NETWORK: {
+                            'subnet': {
+                                '10.10.0.0/16': {
+                                    'static-mapping': static_mappings
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+            'system': {
+                'host-name': 'simulator',
+                'traffic-analysis': {
+                    'dpi': 'enable',
+                    'export': 'enable'
+                }
+            }
+        }
+
+        return config
+
+    def get_dhcp_leases(self):
+        """Output of /api/edge/data.json?data=dhcp_leases."""
+        leases = {}
+
+        for hostname, ip, mac in self._unknown_clients:
+            leases[ip] = {
+                'expiration': '2030/01/01 00:00:00',
+                'pool': LAN_NETWORK,
+                'mac': mac,
+                'client-hostname': hostname
+            }
+
+        data = {
+            'dhcp-server-leases': {
+                LAN_NETWORK: leases
+            }
+        }
+
+        return data
+
+    def get_export(self):
+        """Content of the export topic, traffic per client IP and DPI category."""
+        export = {}
+
+        for hostname, ip, mac in self._clients:
+            if self._random.random() > self._active_ratio:
+                continue
+
+            services = {}
+
+            for category in self._dpi_categories:
+                key = (ip, category)
+                rx_bytes, tx_bytes = self._client_counters.get(key, (0, 0))
+
+                rx_rate = self._random.randint(0, 100000)
+                tx_rate = self._random.randint(0, 20000)
+
+                rx_bytes += rx_rate
+                tx_bytes += tx_rate
+
+                self._client_counters[key] = (rx_bytes, tx_bytes)
+
+                services[category] = {
+                    'rx_bytes': str(rx_bytes),
+                    'tx_bytes': str(tx_bytes),
+                    'rx_rate': str(rx_rate),
+                    'tx_rate': str(tx_rate)
+                }
+
+            export[ip] = services
+
+        return export
+
+    def get_interfaces(self):
+        """Content of the interfaces topic."""
+        interfaces = {}
+
+        for index, name in enumerate(self.interface_names):
+            counters = self._interface_counters.get(name, {stats_key: 0 for stats_key in INTERFACE_STATS})
+
+            for stats_key in INTERFACE_STATS:
+                if 'bytes' in stats_key:
+                    counters[stats_key] += self._random.randint(0, 1000000)
+                elif 'packets' in stats_key or stats_key == 'multicast':
+                    counters[stats_key] += self._random.randint(0, 1000)
+
+            self._interface_counters[name] = counters
+
+            stats = {stats_key: str(counters[stats_key]) for stats_key in INTERFACE_STATS}
+            stats['rx_bps'] = str(self._random.randint(0, 1000000))
+            stats['tx_bps'] = str(self._random.randint(0, 200000))
+
+            interfaces[name] = {
+                'up': 'true',
+                'l1up': 'true',
+                'autoneg': 'true',
+                'speed': '1000',
+                'duplex': 'full',
+                'mac': _get_mac('74:83:c2', index),
+                'mtu': '1500',
+                'addresses': [f'{_get_ip(index, 30)}/24'],
+                'stats': stats
+            }
+
+        return interfaces
+
+    def get_system_stats(self):
+        """Content of the system-stats topic."""
+        system_stats = {
+            'cpu': str(self._random.randint(1, 40)),
+            'uptime': str(int(time.time() - self._started)),
+            'mem': str(self._random.randint(20, 60))
+        }
+
+        return system_stats
+
+    def get_discover(self):
+        """Content of the discover topic, the first device is the router itself."""
+        devices = []
+
+        for index in range(self._neighbours):
+            is_router = index == 0
+
+            device = {
+                'hostname': 'simulator' if is_router else f'neighbour-{index}',
+                'product': PRODUCT if is_router else 'UAP-AC-Lite',
+                'uptime': str(int(time.time() - self._started)),
+                'fwversion': FIRMWARE_VERSION if is_router else 'v4.3.28',
+                'system_status': {},
+                'addresses': [
+                    {
+                        'hwaddr': _get_mac('74:83:c2', 0) if is_router else _get_mac('78:8a:20', index),
+                        'ipv4': self._host if is_router else _get_ip(index, 40)
+                    }
+                ]
+            }
+
+            devices.append(device)
+
+        discover = {
+            'devices': devices
+        }
+
+        return discover
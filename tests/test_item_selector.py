@@ -0,0 +1,91 @@
+from custom_components.edgeos.item_selector import ItemSelector, parse_rules
+
+
+def get_selected(selector, keys):
+    return [key for key in keys if key in selector]
+
+
+def test_no_rules_selects_nothing():
+    selector = ItemSelector()
+
+    assert get_selected(selector, ['eth0', 'switch0']) == []
+
+
+def test_explicit_items():
+    selector = ItemSelector(['eth0'])
+
+    assert get_selected(selector, ['eth0', 'eth1']) == ['eth0']
+
+
+def test_glob_include():
+    selector = ItemSelector(rules=['eth1.*'])
+
+    assert get_selected(selector, ['eth1', 'eth1.10', 'eth1.20', 'xeth1.10']) == ['eth1.10', 'eth1.20']
+
+
+def test_regex_include_matches_whole_key():
+    selector = ItemSelector(rules=['re:eth0|eth1'])
+
+    assert get_selected(selector, ['eth0', 'eth1', 'eth10', 'xeth1', 'eth0.5']) == ['eth0', 'eth1']
+
+
+def test_regex_quantifier():
+    selector = ItemSelector(rules=['re:switch0\\.[0-9]{1,2}'])
+
+    assert get_selected(selector, ['switch0.1', 'switch0.20', 'switch0.100', 'switch0']) == ['switch0.1', 'switch0.20']
+
+
+def test_exclude():
+    selector = ItemSelector(rules=['eth*', '!eth1.*', '!re:eth0\\.(10|20)'])
+
+    keys = ['eth0', 'eth0.10', 'eth0.30', 'eth1', 'eth1.99']
+
+    assert get_selected(selector, keys) == ['eth0', 'eth0.30', 'eth1']
+
+
+def test_exclude_only_selects_nothing():
+    selector = ItemSelector(rules=['!eth1'])
+
+    assert get_selected(selector, ['eth0', 'eth1']) == []
+
+
+def test_explicit_items_cannot_be_excluded():
+    selector = ItemSelector(['eth1.99'], ['eth1.*', '!eth1.99'])
+
+    assert get_selected(selector, ['eth1.10', 'eth1.99']) == ['eth1.10', 'eth1.99']
+
+
+def test_invalid_rule_is_ignored():
+    selector = ItemSelector(rules=['re:eth(', 'switch*'])
+
+    assert get_selected(selector, ['eth(', 'switch0']) == ['switch0']
+
+
+def test_empty_rules_are_ignored():
+    selector = ItemSelector(rules=[' ', '!', 'eth0'])
+
+    assert get_selected(selector, ['eth0', 'eth1']) == ['eth0']
+
+
+def test_parse_rules():
+    assert parse_rules(' eth1.* , !eth1.99,re:switch0\\.(10|20) ') == ['eth1.*', '!eth1.99', 're:switch0\\.(10|20)']
+
+
+def test_parse_rules_keeps_commas_within_groups():
+    assert parse_rules('re:eth[0-9]{1,2},re:(a|b,c)') == ['re:eth[0-9]{1,2}', 're:(a|b,c)']
+
+
+def test_parse_rules_keeps_escaped_commas():
+    assert parse_rules('re:a\\,b, c') == ['re:a\\,b', 'c']
+
+
+def test_parse_rules_keeps_spaces_within_rules():
+    assert parse_rules('re:Living Room.*') == ['re:Living Room.*']
+
+
+def test_parse_rules_of_list():
+    rules = ['re:a{1,2}', 'b']
+
+    assert parse_rules(rules) == rules
+    assert parse_rules(None) == []
+    assert parse_rules('') == []